@@ -7,7 +7,8 @@ import aiocontextvars as contextvars
 from aiopg.sa.connection import SAConnection
 import aiopg.sa.engine
 
-transaction_connections_var = contextvars.ContextVar("transaction_connections")
+# One context variable per connection key, created the first time the key is used
+_connection_vars: Dict[str, contextvars.ContextVar] = {}
 
 
 def get_current_task() -> asyncio.Task:
@@ -52,8 +53,8 @@ class TaskContextConnection:
 
     The current asyncio.Task has a context attribute that keeps track of various keys.
     We'll use this to store the open connection so we can perform our nested/conditional
-    transaction logic in :py:class:`transaction`. The actual value stored on the context
-    is a dict of connections keyed by the engine.
+    transaction logic in :py:class:`transaction`. Each connection key (the engine) has
+    its own context variable holding the connection.
     """
 
     def __init__(self, connection_key: str) -> None:
@@ -65,6 +66,14 @@ class TaskContextConnection:
         """
         self.connection_key = connection_key
         self._token: Optional[contextvars.Token] = None
+        self._var = _connection_vars.get(connection_key)
+        if self._var is None:
+            self._var = _connection_vars.setdefault(
+                connection_key,
+                contextvars.ContextVar(
+                    f"transaction_connection:{connection_key}", default=None
+                ),
+            )
 
         # Set the asyncio task context if it's not set already. We'll look in the
         # context for an open connection.
@@ -72,15 +81,9 @@ class TaskContextConnection:
         if not hasattr(task, "context"):
             task.context = contextvars.copy_context()
 
-    @classmethod
-    def _get_connections(cls) -> Dict[str, LockedConnection]:
-        """Get the map of connections from the task context"""
-        global transaction_connections_var
-        return transaction_connections_var.get({})
-
     def get(self) -> Optional[LockedConnection]:
         """If there is already a connection stored, get it"""
-        return self._get_connections().get(self.connection_key)
+        return self._var.get()
 
     def set(self, conn: LockedConnection) -> contextvars.Token:
         """Set the connection on the context
@@ -92,10 +95,7 @@ class TaskContextConnection:
             contextvars token used to reset the var in :py:meth:`.clear`
 
         """
-        global transaction_connections_var
-        connections = self._get_connections()
-        connections[self.connection_key] = conn
-        token = transaction_connections_var.set(connections)
+        token = self._var.set(conn)
         self._token = token
         return token
 
@@ -104,8 +104,7 @@ class TaskContextConnection:
         if not self._token:
             raise ValueError("Token must be defined")
 
-        global transaction_connections_var
-        transaction_connections_var.reset(self._token)
+        self._var.reset(self._token)
 
 
 class transaction:
@@ -2,12 +2,27 @@
 import asyncio
 from datetime import datetime
 from enum import Enum, EnumMeta
+import functools
 import inspect
-from typing import Any, Callable, Dict, Generator, List, Optional, Sequence, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import UUID as stdlib_uuid
 
 from aenum import Enum as AEnum, EnumMeta as AEnumMeta
 from pydantic import BaseModel, PositiveFloat, PositiveInt
+from pydantic.fields import ModelField
 from pydantic.types import UUID4
 from sqlalchemy import (
     and_,
@@ -39,6 +54,10 @@ from pynocular.exceptions import (
 from pynocular.nested_database_model import NestedDatabaseModel
 
 
+# Characters that can appear in the canonical hyphenated form of a UUID
+_UUID_CHARACTERS = frozenset("0123456789abcdefABCDEF-")
+
+
 def is_valid_uuid(string: str) -> bool:
     """Check if a string is a valid UUID
 
@@ -49,6 +68,25 @@ def is_valid_uuid(string: str) -> bool:
         Whether or not the string is a well-formed UUIDv4
 
     """
+    if not isinstance(string, str):
+        return False
+
+    # Almost every UUID is in the canonical 8-4-4-4-12 form, which can be checked
+    # without parsing it. Anything else falls back to the UUID constructor, which
+    # also accepts forms like braces or no hyphens.
+    if (
+        len(string) == 36
+        and string[8] == string[13] == string[18] == string[23] == "-"
+        and string.count("-") == 4
+        and _UUID_CHARACTERS.issuperset(string)
+    ):
+        return True
+
+    # Every form the UUID constructor accepts has at least 32 characters, so
+    # shorter strings can be rejected without raising and catching an error
+    if len(string) < 32:
+        return False
+
     try:
         stdlib_uuid(string, version=4)
         return True
@@ -59,6 +97,8 @@ def is_valid_uuid(string: str) -> bool:
 class UUID_STR(str):
     """A string that represents a UUID4 value"""
 
+    __slots__ = ()
+
     @classmethod
     def __get_validators__(cls) -> Generator:
         """Get the validators for the given class"""
@@ -71,18 +111,66 @@ class UUID_STR(str):
         Args:
             v: The value to validate
 
+        Returns:
+            The value as a string
+
+        Raises:
+            ValueError: The value is not a UUID or a valid UUID string
+
         """
-        if isinstance(v, stdlib_uuid) or (isinstance(v, str) and is_valid_uuid(v)):
-            return str(v)
-        else:
-            raise ValueError("invalid UUID string")
+        converter = _UUID_STR_CONVERTERS.get(type(v))
+        if converter is None:
+            # Fall back to isinstance checks for subclasses
+            converter = next(
+                (
+                    converter
+                    for value_type, converter in _UUID_STR_CONVERTERS.items()
+                    if isinstance(v, value_type)
+                ),
+                None,
+            )
+            if converter is None:
+                raise ValueError("invalid UUID string")
+
+        return converter(v)
+
+
+def _convert_uuid_string(v: str) -> str:
+    """Convert a UUID string to a plain string
+
+    Args:
+        v: The string to convert
+
+    Returns:
+        The string. str() of a plain string returns the same object, so valid
+        strings aren't copied.
+
+    Raises:
+        ValueError: The string is not a valid UUID
+
+    """
+    if is_valid_uuid(v):
+        return str(v)
+    raise ValueError("invalid UUID string")
+
 
+# Functions that convert each type of value UUID_STR accepts, keyed on the exact type
+# so validating doesn't need a chain of isinstance checks
+_UUID_STR_CONVERTERS: Dict[type, Callable[[Any], str]] = {
+    str: _convert_uuid_string,
+    stdlib_uuid: str,
+}
 
+
+@functools.lru_cache(maxsize=None)
 def nested_model(
     db_model_class: "DatabaseModel", reference_field: str = None
 ) -> Callable:
     """Generate a NestedModel class with dynamic model references
 
+    The classes only depend on the arguments, so each one is built once and shared by
+    every field that references the same model and field.
+
     Args:
         db_model_class: The specific model class that will be nested. This will be a
             subclass of `DatabaseModel`
@@ -114,6 +202,152 @@ def nested_model(
     return NestedModel
 
 
+def _get_sa_type(field_type: Any, max_length: Optional[int]) -> Any:
+    """Get the SQLAlchemy column type for a Pydantic field type
+
+    Args:
+        field_type: The outer type of the Pydantic field
+        max_length: The max length configured on the field, if any
+
+    Returns:
+        The SQLAlchemy type to use for the column
+
+    Raises:
+        DatabaseModelMisconfigured: The field type has no SQLAlchemy equivalent
+
+    """
+    if field_type.__class__ in (AEnumMeta, EnumMeta):
+        # Enums are SchemaTypes that register create/drop events on every table they
+        # are attached to, so each column needs its own instance
+        return SQLEnum(field_type, values_callable=lambda obj: [e.value for e in obj])
+
+    field_type_name = field_type.__name__
+    if field_type_name.startswith("Constrained"):
+        # Pydantic builds a new constrained type class for every field that uses one,
+        # so key these on the type name (and length) rather than the class
+        if field_type_name != "ConstrainedStrValue":
+            max_length = None
+        return _sa_type_for(None, field_type_name, max_length)
+
+    return _sa_type_for(field_type, field_type_name, None)
+
+
+@functools.lru_cache(maxsize=None)
+def _sa_type_for(
+    field_type: Any, field_type_name: str, max_length: Optional[int]
+) -> Any:
+    """Get the shared SQLAlchemy column type for a Pydantic field type
+
+    Apart from Enums (see :py:func:`_get_sa_type`), the types built here hold no
+    per-column or per-table state, so one instance can be shared by every model that
+    has a field of the same type. Caching them means we only build each type once per
+    process instead of once per field on every model definition.
+
+    Args:
+        field_type: The outer type of the Pydantic field, or None for constrained
+            types, which are looked up by name
+        field_type_name: The name of the field type. Pydantic builds constrained types
+            dynamically, so we check these by name.
+        max_length: The max length of a constrained string field
+
+    Returns:
+        The SQLAlchemy type to use for the column
+
+    Raises:
+        DatabaseModelMisconfigured: The field type has no SQLAlchemy equivalent
+
+    """
+    if field_type is str:
+        return VARCHAR()
+    elif field_type_name == "ConstrainedStrValue":
+        # This is because pydantic is doing some kind of dynamic type construction.
+        # See: https://github.com/samuelcolvin/pydantic/blob/e985857e5a9ede8d346b010a5a039aa84a089826/pydantic/types.py#L245-L263
+        return VARCHAR(max_length)
+    elif field_type in (int, PositiveInt) or field_type_name == "ConstrainedIntValue":
+        return Integer()
+    elif (
+        field_type in (float, PositiveFloat)
+        or field_type_name == "ConstrainedFloatValue"
+    ):
+        return Float()
+    elif field_type is bool:
+        return Boolean()
+    elif field_type in (dict, Dict):
+        return JSONB(none_as_null=True)
+    elif field_type in (UUID4, stdlib_uuid, UUID_STR):
+        return sqlalchemy_uuid()
+    elif field_type is datetime:
+        return TIMESTAMP(timezone=True)
+    # TODO - how are people using this today? Is there a class we need to make or can we reuse one
+    # elif field_type is bit:
+    #     return Bit
+
+    raise DatabaseModelMisconfigured(
+        f"Unsupported type {field_type if field_type is not None else field_type_name}"
+    )
+
+
+# Types of field values that Pydantic's dict() copies or converts
+_CONTAINER_TYPES = (dict, list, tuple, set, frozenset, BaseModel)
+
+
+# Field types whose values come back from the database already in the form Pydantic
+# would validate them to. UUID4 and stdlib UUID fields are not included because their
+# columns return strings.
+_DB_NATIVE_FIELD_TYPES = frozenset(
+    (str, int, float, bool, dict, datetime, UUID_STR, PositiveInt, PositiveFloat)
+)
+
+# Config options and constrained type settings that make validation change a value
+# rather than only check it
+_VALUE_CHANGING_OPTIONS = (
+    "use_enum_values",
+    "anystr_strip_whitespace",
+    "anystr_lower",
+    "anystr_upper",
+    "strip_whitespace",
+    "to_lower",
+    "to_upper",
+)
+
+
+def _changes_values(config: Any) -> bool:
+    """Check if a model config or constrained type changes values while validating
+
+    Args:
+        config: A Pydantic model config or constrained type
+
+    Returns:
+        Whether any of the value changing options are turned on
+
+    """
+    return any(getattr(config, option, False) for option in _VALUE_CHANGING_OPTIONS)
+
+
+def _is_db_native_field(field: ModelField) -> bool:
+    """Check if the database returns values for a field that don't need validating
+
+    Args:
+        field: The Pydantic field
+
+    Returns:
+        Whether values read from the field's column can be set on a model as they are
+
+    """
+    if field.alias != field.name or field.sub_fields:
+        return False
+
+    field_type = field.type_
+    return (
+        field_type in _DB_NATIVE_FIELD_TYPES
+        or field_type.__class__ in (AEnumMeta, EnumMeta)
+        or (
+            field_type.__name__.startswith("Constrained")
+            and not _changes_values(field_type)
+        )
+    )
+
+
 def database_model(table_name: str, database_info: DBInfo) -> "DatabaseModel":
     """Decorator that adds SQL functionality to Pydantic BaseModel objects
 
@@ -158,13 +392,16 @@ class DatabaseModel:
 
     # We may have times where we need a compound primary key.
     # We store each one into this list and have our query functions
-    # handle using it
-    _primary_keys: List[Column] = None
+    # handle using it. The names are also kept as a tuple (for ordered iteration) and a
+    # frozenset (for membership checks)
+    _primary_keys: Tuple[Column, ...] = None
+    _primary_key_names: Tuple[str, ...] = None
+    _primary_key_names_set: FrozenSet[str] = None
 
     # Some fields are exclusively produced by the database server
     # For all save operations, we need to get those values from the database
     # These are the server_default and server_onupdate functions in SQLAlchemy
-    _db_managed_fields: List[str] = None
+    _db_managed_fields: FrozenSet[str] = None
 
     # The following tables track which attributes on the model are nested model
     # references
@@ -181,6 +418,15 @@ class DatabaseModel:
     # This can be used to access the table when defining where expressions
     columns: ImmutableColumnCollection = None
 
+    # Whether database records can be turned into models without validating them. See
+    # :py:meth:`_from_db_record`.
+    _construct_from_db_records: bool = None
+
+    # Fields whose values Pydantic's dict() may copy, such as JSONB dicts. When none of
+    # them hold a container, to_dict reads the field values straight from the model.
+    # None means to_dict always goes through dict().
+    _to_dict_container_fields: Optional[Tuple[str, ...]] = None
+
     @classmethod
     def initialize_table(cls, table_name: str, database_info: DBInfo) -> None:
         """Returns a SQLAlchemy table definition to expose SQLAlchemy functions
@@ -197,9 +443,9 @@ class DatabaseModel:
                 or cannot be converted to a Table
 
         """
-        cls._primary_keys = []
+        primary_keys = []
         cls._database_info = database_info
-        cls._db_managed_fields = []
+        db_managed_fields = []
         cls._nested_attr_table_field_map = {}
         cls._nested_table_field_attr_map = {}
         cls._nested_model_attributes = set()
@@ -212,36 +458,7 @@ class DatabaseModel:
             fetch_on_create = field.field_info.extra.get("fetch_on_create", False)
             fetch_on_update = field.field_info.extra.get("fetch_on_update", False)
 
-            if field.type_ is str:
-                type = VARCHAR
-            elif field.type_.__name__ == "ConstrainedStrValue":
-                # This is because pydantic is doing some kind of dynamic type construction.
-                # See: https://github.com/samuelcolvin/pydantic/blob/e985857e5a9ede8d346b010a5a039aa84a089826/pydantic/types.py#L245-L263
-                length = field.field_info.max_length
-                type = VARCHAR(length)
-            elif (
-                field.type_ in (int, PositiveInt)
-                or field.type_.__name__ == "ConstrainedIntValue"
-            ):
-                type = Integer
-            elif (
-                field.type_ in (float, PositiveFloat)
-                or field.type_.__name__ == "ConstrainedFloatValue"
-            ):
-                type = Float
-            elif field.type_.__class__ in (AEnumMeta, EnumMeta):
-                type = SQLEnum(
-                    field.type_, values_callable=lambda obj: [e.value for e in obj]
-                )
-            elif field.type_ is bool:
-                type = Boolean
-            elif field.type_ in (dict, Dict):
-                type = JSONB(none_as_null=True)
-            elif field.type_ in (UUID4, stdlib_uuid, UUID_STR):
-                type = sqlalchemy_uuid()
-            elif field.type_ is datetime:
-                type = TIMESTAMP(timezone=True)
-            elif field.type_.__name__ == "NestedModel":
+            if field.type_.__name__ == "NestedModel":
                 cls._nested_model_attributes.add(name)
                 # If the field name on the NestedModel type is not None, use that for the
                 # column name
@@ -255,12 +472,9 @@ class DatabaseModel:
                     name = field.type_.reference_field_name
 
                 # Assume all IDs are UUIDs for now
-                type = sqlalchemy_uuid()
-            # TODO - how are people using this today? Is there a class we need to make or can we reuse one
-            # elif field.type_ is bit:
-            #     type = Bit
+                type = _sa_type_for(UUID4, UUID4.__name__, None)
             else:
-                raise DatabaseModelMisconfigured(f"Unsupported type {field.type_}")
+                type = _get_sa_type(field.type_, field.field_info.max_length)
 
             column = Column(
                 name, type, primary_key=is_primary_key, nullable=is_nullable
@@ -268,19 +482,45 @@ class DatabaseModel:
 
             if fetch_on_create:
                 column.server_default = FetchedValue()
-                cls._db_managed_fields.append(name)
+                db_managed_fields.append(name)
 
             if fetch_on_update:
                 column.server_onupdate = FetchedValue()
-                cls._db_managed_fields.append(name)
+                db_managed_fields.append(name)
 
             if is_primary_key:
-                cls._primary_keys.append(column)
+                primary_keys.append(column)
 
             columns.append(column)
 
+        cls._primary_keys = tuple(primary_keys)
+        cls._primary_key_names = tuple(primary_key.name for primary_key in primary_keys)
+        cls._primary_key_names_set = frozenset(cls._primary_key_names)
+        cls._db_managed_fields = frozenset(db_managed_fields)
         cls._table = Table(table_name, MetaData(), *columns)
         cls.columns = cls._table.c
+        cls._construct_from_db_records = (
+            not cls._nested_model_attributes
+            and not cls.__validators__
+            and not cls.__pre_root_validators__
+            and not cls.__post_root_validators__
+            and cls.from_dict.__func__ is DatabaseModel.from_dict.__func__
+            and cls.__init__ is BaseModel.__init__
+            and not _changes_values(cls.__config__)
+            and all(_is_db_native_field(field) for field in cls.__fields__.values())
+        )
+        if (
+            cls.dict is BaseModel.dict
+            and getattr(cls, "__include_fields__", None) is None
+            and getattr(cls, "__exclude_fields__", None) is None
+        ):
+            cls._to_dict_container_fields = tuple(
+                field.name
+                for field in cls.__fields__.values()
+                if field.type_ in (dict, Dict) or field.sub_fields
+            )
+        else:
+            cls._to_dict_container_fields = None
 
     @classmethod
     def get_table(cls) -> Table:
@@ -430,7 +670,7 @@ class DatabaseModel:
                 raise InvalidFieldValue(message=e.diag.message_primary)
             records = await result.fetchall()
 
-            return [cls.from_dict(dict(record)) for record in records]
+            return [cls._from_db_record(record) for record in records]
 
     @classmethod
     async def create(cls, **data) -> "DatabaseModel":
@@ -475,15 +715,21 @@ class DatabaseModel:
         async with (
             await DBEngine.transaction(cls._database_info, is_conditional=False)
         ) as conn:
+            query = insert(cls._table).values(values)
+            if not cls._db_managed_fields:
+                await conn.execute(query)
+                return models
+
             result = await conn.execute(
-                insert(cls._table).values(values).returning(cls._table)
+                query.returning(
+                    *(cls._table.c[field] for field in cls._db_managed_fields)
+                )
             )
             # Set db managed column information on the object
             rows = await result.fetchall()
             for row, model in zip(rows, models):
-                record_dict = dict(row)
                 for column in cls._db_managed_fields:
-                    col_val = record_dict.get(column)
+                    col_val = row[column]
                     if col_val is not None:
                         setattr(model, column, col_val)
 
@@ -550,11 +796,15 @@ class DatabaseModel:
             where_expressions.append(primary_key == primary_key_value)
             primary_key_dict[primary_key.name] = primary_key_value
 
-        modified_kwargs = {}
-        for field_name, value in kwargs.items():
-            db_field_name = cls._nested_attr_table_field_map.get(field_name, field_name)
-            modified_kwargs[db_field_name] = value
+        # Map any nested model attribute names to their table field names
+        get_db_field_name = cls._nested_attr_table_field_map.get
+        modified_kwargs = {
+            get_db_field_name(field_name, field_name): value
+            for field_name, value in kwargs.items()
+        }
 
+        # `update` uses UPDATE ... RETURNING, so an empty result means no record
+        # matched the primary key; there is no need for a follow-up SELECT
         updated_records = await cls.update(where_expressions, modified_kwargs)
         if len(updated_records) == 0:
             raise DatabaseRecordNotFound(cls._table.name, **primary_key_dict)
@@ -594,7 +844,9 @@ class DatabaseModel:
             except InvalidTextRepresentation as e:
                 raise InvalidFieldValue(message=e.diag.message_primary)
 
-            return [cls.from_dict(dict(record)) for record in await results.fetchall()]
+            return [
+                cls._from_db_record(record) for record in await results.fetchall()
+            ]
 
     async def save(self, include_nested_models=False) -> None:
         """Update the database record this object represents with its current state
@@ -607,10 +859,8 @@ class DatabaseModel:
 
         dict_self = self.to_dict()
 
-        primary_key_names = [primary_key.name for primary_key in self._primary_keys]
-
         for field in self._db_managed_fields:
-            if field in primary_key_names and dict_self[field] is not None:
+            if field in self._primary_key_names_set and dict_self[field] is not None:
                 continue
 
             # Remove any fields that the database calculates
@@ -633,11 +883,23 @@ class DatabaseModel:
                         # DB and the DB has the latest state
                         continue
 
-            record = await conn.execute(
+            query = (
                 insert(self._table)
                 .values(dict_self)
-                .on_conflict_do_update(index_elements=primary_key_names, set_=dict_self)
-                .returning(self._table)
+                .on_conflict_do_update(
+                    index_elements=self._primary_key_names, set_=dict_self
+                )
+            )
+            if not self._db_managed_fields:
+                await conn.execute(query)
+                return
+
+            # Only the db managed columns need to be sent back, since every other
+            # value on the record came from this object
+            record = await conn.execute(
+                query.returning(
+                    *(self._table.c[field] for field in self._db_managed_fields)
+                )
             )
 
             row = await record.fetchone()
@@ -662,6 +924,10 @@ class DatabaseModel:
     async def fetch(self, resolve_references: bool = False) -> None:
         """Gets the latest of the object from the database and updates itself
 
+        Field values are copied straight into the model unless its config forbids
+        mutation or validates assignment, in which case each field is set through
+        `setattr` so those checks still apply.
+
         Args:
             resolve_references: If True, resolve any nested key references
 
@@ -676,8 +942,19 @@ class DatabaseModel:
         else:
             new_self = await self.get(**get_params)
 
-        for attr_name, new_attr_val in new_self.dict().items():
-            setattr(self, attr_name, new_attr_val)
+        config = self.__config__
+        if (
+            not config.allow_mutation
+            or config.validate_assignment
+            or getattr(config, "frozen", False)
+        ):
+            for attr_name, new_attr_val in new_self.__dict__.items():
+                setattr(self, attr_name, new_attr_val)
+        else:
+            # Pydantic keeps field values in __dict__, so copy them over directly
+            # rather than serializing the new object with dict() to set them back
+            self.__dict__.update(new_self.__dict__)
+            self.__fields_set__.update(new_self.__fields__)
 
     async def delete(self) -> None:
         """Delete this record from the database"""
@@ -717,6 +994,26 @@ class DatabaseModel:
             modified_dict[modified_key] = value
         return cls(**modified_dict)
 
+    @classmethod
+    def _from_db_record(cls, record: Mapping[str, Any]) -> "DatabaseModel":
+        """Instantiate a DatabaseModel object from a record read from its table
+
+        Records have already been validated on their way into the database, so when
+        every column comes back as the type its field expects, the model is built
+        without running Pydantic validation. Models with nested models, custom
+        validators, or a custom :py:meth:`from_dict` are always validated.
+
+        Args:
+            record: The database record
+
+        Returns:
+            The DatabaseModel object
+
+        """
+        if cls._construct_from_db_records:
+            return cls.construct(**record)
+        return cls.from_dict(dict(record))
+
     def to_dict(
         self, serialize: bool = False, include_keys: Optional[Sequence] = None
     ) -> Dict[str, Any]:
@@ -739,8 +1036,17 @@ class DatabaseModel:
                 __base_props__ being set
 
         """
+        field_values = self.__dict__
+        container_fields = self._to_dict_container_fields
+        if container_fields is None or any(
+            isinstance(field_values[name], _CONTAINER_TYPES)
+            for name in container_fields
+        ):
+            # Let Pydantic copy containers so changing the result can't change the model
+            field_values = self.dict()
+
         _dict = {}
-        for prop_name, prop_value in self.dict().items():
+        for prop_name, prop_value in field_values.items():
             if serialize:
                 if isinstance(prop_value, Enum):
                     prop_value = prop_value.name
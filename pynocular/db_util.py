@@ -5,6 +5,7 @@ import re
 
 from aiopg.sa.connection import SAConnection
 import sqlalchemy as sa
+from sqlalchemy.engine import Dialect
 from sqlalchemy.sql.ddl import CreateTable
 
 from pynocular.engines import DBEngine, DBInfo
@@ -12,6 +13,20 @@ from pynocular.exceptions import InvalidSqlIdentifierErr
 
 logger = logging.getLogger()
 
+# Names that none of the cleaning steps would change
+_CLEAN_NAME_RE = re.compile(r"[a-z_][a-z0-9_]*")
+
+# Characters that aren't allowed in cleaned names
+_SPECIAL_CHARS_RE = re.compile(r"[^a-zA-Z0-9_]+")
+
+# Translation tables for replacing spaces and/or dashes with underscores, keyed on
+# whether spaces and whether dashes are replaced
+_UNDERSCORE_TRANSLATIONS = {
+    (True, True): str.maketrans(" -", "__"),
+    (True, False): str.maketrans(" ", "_"),
+    (False, True): str.maketrans("-", "_"),
+}
+
 
 async def is_database_available(db_info: DBInfo) -> bool:
     """Check if the database is available
@@ -38,6 +53,10 @@ async def is_database_available(db_info: DBInfo) -> bool:
 async def create_new_database(connection_string: str, db_name: str) -> None:
     """Create a new database database for testing
 
+    Note:
+        `db_name` is interpolated into the SQL, so it must be a trusted identifier,
+        e.g. one returned by `get_cleaned_db_name`.
+
     Args:
         connection_string: A connection string for the database
         db_name: the name of the database to create
@@ -45,9 +64,10 @@ async def create_new_database(connection_string: str, db_name: str) -> None:
     """
     existing_db = DBInfo(connection_string)
     conn = await (await DBEngine.get_engine(existing_db)).acquire()
-    # End existing commit
-    await conn.execute("commit")
-    # Create db
+    # aiopg connections are always in autocommit mode, so there is no open
+    # transaction to commit first. The statements have to be sent separately since
+    # Postgres runs a multi-statement query in a transaction block, which DROP and
+    # CREATE DATABASE can't run in.
     await conn.execute(f"drop database if exists {db_name}")
     await conn.execute(f"create database {db_name}")
     await conn.close()
@@ -63,10 +83,54 @@ async def create_table(db_info: DBInfo, table: sa.Table) -> None:
     """
     engine = await DBEngine.get_engine(db_info)
     conn = await engine.acquire()
-    await conn.execute(CreateTable(table))
+    await conn.execute(_get_create_table_sql(table, engine.dialect))
+    await conn.close()
+
+
+async def create_tables(db_info: DBInfo, *tables: sa.Table) -> None:
+    """Create several tables in database with a single query
+
+    Args:
+        db_info: Information for the database to connect to
+        tables: The tables to create
+
+    """
+    if not tables:
+        return
+
+    engine = await DBEngine.get_engine(db_info)
+    conn = await engine.acquire()
+    await conn.execute(
+        ";\n".join(_get_create_table_sql(table, engine.dialect) for table in tables)
+    )
     await conn.close()
 
 
+def _get_create_table_sql(table: sa.Table, dialect: Dialect) -> str:
+    """Compile the CREATE TABLE statement for a table
+
+    Tables don't change once their model is defined, so the statement is compiled
+    once per dialect and kept in the table's info dict. That way it goes away along
+    with the table.
+
+    Args:
+        table: The table to create
+        dialect: The dialect of the engine that will run the statement
+
+    Returns:
+        The CREATE TABLE statement
+
+    """
+    statements = table.info.setdefault("_create_table_sql", {})
+    statement = statements.get(dialect.name)
+    if statement is None:
+        statement = statements[dialect.name] = str(
+            CreateTable(table).compile(dialect=dialect)
+        )
+
+    return statement
+
+
 async def drop_table(db_info: DBInfo, table: sa.Table) -> None:
     """Drop table in database
 
@@ -81,6 +145,24 @@ async def drop_table(db_info: DBInfo, table: sa.Table) -> None:
     await conn.close()
 
 
+async def drop_tables(db_info: DBInfo, *tables: sa.Table) -> None:
+    """Drop several tables in database with a single statement
+
+    Args:
+        db_info: Information for the database to connect to
+        tables: The tables to drop
+
+    """
+    if not tables:
+        return
+
+    table_names = ", ".join(table.name for table in tables)
+    engine = await DBEngine.get_engine(db_info)
+    conn = await engine.acquire()
+    await conn.execute(f"drop table if exists {table_names}")
+    await conn.close()
+
+
 async def setup_datetime_trigger(conn: SAConnection) -> None:
     """Set up created_at/updated_at datetime trigger
 
@@ -173,6 +255,10 @@ def get_cleaned_db_name(
             after being cleaned
 
     """
+    # Most names are already clean, in which case there is nothing to transform
+    if _CLEAN_NAME_RE.fullmatch(name) and len(name) <= limit:
+        return name
+
     cleaned_name = name
 
     if lowercase:
@@ -181,14 +267,16 @@ def get_cleaned_db_name(
     if remove_leading_numbers:
         cleaned_name = cleaned_name.lstrip("0123456789")
 
-    if replace_spaces_with_underscores:
-        cleaned_name = "_".join(cleaned_name.split(" "))
-
-    if replace_dashes_with_underscores:
-        cleaned_name = "_".join(cleaned_name.split("-"))
+    # Replace spaces and dashes in a single pass
+    underscore_translation = _UNDERSCORE_TRANSLATIONS.get(
+        (replace_spaces_with_underscores, replace_dashes_with_underscores)
+    )
+    if underscore_translation is not None:
+        cleaned_name = cleaned_name.translate(underscore_translation)
 
     if remove_special_chars:
-        cleaned_name = re.sub(r"[^a-zA-Z0-9_]*", "", cleaned_name)
+        # This returns the same string if there is nothing to remove
+        cleaned_name = _SPECIAL_CHARS_RE.sub("", cleaned_name)
 
     if len(cleaned_name) == 0 or len(cleaned_name) > limit:
         raise InvalidSqlIdentifierErr(cleaned_name)
@@ -69,7 +69,7 @@ async def get_aiopg_engine(
             pool_recycle=POOL_RECYCLE,
         )
         _engines[cache_key] = engine
-        logger.debug(f"DB engine created successfully: {engine}")
+        logger.debug("DB engine created successfully: %s", engine)
 
     logger.debug("DB engine retrieved")
     return engine
@@ -7,6 +7,10 @@ from pynocular.exceptions import NestedDatabaseModelNotResolved
 class NestedDatabaseModel:
     """Class that wraps nested DatabaseModels"""
 
+    # One of these gets created for every nested reference on every record we load, so
+    # keep the instances as small as possible
+    __slots__ = ("_model_cls", "_model", "_primary_key_name", "_pk_value")
+
     def __init__(
         self,
         model_cls: Callable,
@@ -26,7 +30,7 @@ class NestedDatabaseModel:
         # We can only support nested database models that are based off of a single
         # unique identifier
         self._primary_key_name = model_cls._primary_keys[0].name
-        setattr(self, self._primary_key_name, _id)
+        self._pk_value = _id
 
     def get_primary_id(self) -> Any:
         """Standard interface for returning the id of a field
@@ -35,19 +39,19 @@ class NestedDatabaseModel:
             The ID value for the proxied DatabaseModel
 
         """
-        return getattr(self, self._primary_key_name)
+        return self._pk_value
 
     async def fetch(self) -> None:
         """Resolves the reference via the id set"""
         if self._model is None:
-            self._model = await self._model_cls.get(
-                getattr(self, self._primary_key_name)
-            )
+            self._model = await self._model_cls.get(self._pk_value)
 
     def __getattr__(self, attr_name: str) -> Any:
         """Wrapper around getattr
 
-        This will only get hit if the class doesn't have a reference to attr_name
+        This will only get hit if the class doesn't have a reference to attr_name. The
+        primary key of the referenced model is always available, even if the reference
+        hasn't been resolved yet.
 
         Args:
             attr_name: The name of the attribute
@@ -56,7 +60,15 @@ class NestedDatabaseModel:
             The value of the attribute on the object
 
         """
-        if self._model is None:
+        if attr_name.startswith("__") or attr_name in NestedDatabaseModel.__slots__:
+            # Dunder lookups (e.g. `__dict__`, which slotted instances don't have)
+            # shouldn't be proxied, and a slot that hasn't been set yet (e.g. while
+            # copying) shouldn't recurse back into this method
+            raise AttributeError(attr_name)
+
+        if attr_name == self._primary_key_name:
+            return self._pk_value
+        elif self._model is None:
             raise NestedDatabaseModelNotResolved(self._model_cls, self.get_primary_id())
         else:
             return getattr(self._model, attr_name)
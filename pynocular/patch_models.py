@@ -1,7 +1,9 @@
 """Context manager for mocking db calls for DatabaseModels during tests"""
 from contextlib import contextmanager
 import functools
-from typing import Any, Dict, List, Optional
+import itertools
+import operator as python_operator
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
 from unittest.mock import patch
 from uuid import uuid4
 
@@ -19,9 +21,11 @@ from sqlalchemy.sql.elements import (
     True_,
     UnaryExpression,
 )
+from sqlalchemy.sql import operators
 from sqlalchemy.sql.operators import in_op, is_, is_false, is_not
 
 from pynocular.database_model import DatabaseModel
+from pynocular.exceptions import DatabaseModelMissingField, DatabaseRecordNotFound
 
 
 @contextmanager
@@ -42,20 +46,108 @@ def patch_database_model(
     """
     models = list(models) if models is not None else []
 
-    def match(model: DatabaseModel, expression: BinaryExpression) -> bool:
-        """Function to match the value with the expected one in the expression
+    # Read the class metadata once rather than on every call
+    primary_key_names = model_cls._primary_key_names
+    nested_model_attributes = tuple(model_cls._nested_model_attributes)
+
+    # attrgetter returns a bare value rather than a tuple when given a single name, and
+    # can't be built without any names
+    get_primary_key_attrs = (
+        python_operator.attrgetter(*primary_key_names) if primary_key_names else None
+    )
+    has_composite_primary_key = len(primary_key_names) > 1
+
+    def get_primary_key_values(model: DatabaseModel) -> Tuple[Any, ...]:
+        """Get the primary key values of a model
 
         Args:
             model: The db model that represents a model in the "db".
-            expression: The expression object to compare to.
 
         Returns:
-            True if the expression operator is True.
+            The values of the primary keys, in the order of the class primary keys.
 
         """
-        return expression.operator(
-            model.get(expression.left.name), expression.right.value
-        )
+        if get_primary_key_attrs is None:
+            return ()
+        if has_composite_primary_key:
+            return get_primary_key_attrs(model)
+        return (get_primary_key_attrs(model),)
+
+    # Index the models by their primary keys so lookups by primary key don't need to
+    # scan every model. Tests can change the primary keys of the models in place, so
+    # entries are checked when they are read and the index is rebuilt when they miss.
+    models_by_primary_key: Dict[Tuple[Any, ...], DatabaseModel] = {}
+
+    def index_models() -> None:
+        """Rebuild the primary key index from the models"""
+        models_by_primary_key.clear()
+        for model in models:
+            models_by_primary_key.setdefault(get_primary_key_values(model), model)
+
+    def find_model(primary_key_values: Tuple[Any, ...]) -> Optional[DatabaseModel]:
+        """Find the model that has the given primary key values
+
+        Args:
+            primary_key_values: The values of the primary keys, in the order of the
+                class primary keys.
+
+        Returns:
+            The matching model, or None if there isn't one.
+
+        """
+        if not primary_key_names:
+            # Without primary keys there's nothing to tell the models apart, so every
+            # model matches, the same as an empty where clause
+            return models[0] if models else None
+
+        model = models_by_primary_key.get(primary_key_values)
+        if model is None or get_primary_key_values(model) != primary_key_values:
+            index_models()
+            model = models_by_primary_key.get(primary_key_values)
+        return model
+
+    index_models()
+
+    def remove_models(predicate: Callable[[DatabaseModel], bool]) -> None:
+        """Remove the models that match a predicate from the models and the index
+
+        Args:
+            predicate: Function that returns True if the model should be removed.
+
+        """
+        # Delete in place, back to front so the remaining indices stay valid, rather
+        # than copying every model that is kept into a new list
+        for index in range(len(models) - 1, -1, -1):
+            model = models[index]
+            if predicate(model):
+                models_by_primary_key.pop(get_primary_key_values(model), None)
+                del models[index]
+
+    def upsert_model(model: DatabaseModel) -> None:
+        """Add a model, or update the model that has the same primary keys
+
+        Args:
+            model: The model to save.
+
+        """
+        # Put uuids into any primary key that isn't set yet.
+        for primary_key_name in primary_key_names:
+            val = getattr(model, primary_key_name)
+            if val is None:
+                setattr(model, primary_key_name, str(uuid4()))
+
+        # Look up the model that has the same primary keys
+        primary_key_values = get_primary_key_values(model)
+        matched_model = find_model(primary_key_values)
+
+        if matched_model is None:
+            # Add a new model to the models since this model didn't exist before.
+            models.append(model)
+            models_by_primary_key[primary_key_values] = model
+        else:
+            # Update the matching model.
+            for attr, val in model.dict().items():
+                setattr(matched_model, attr, val)
 
     async def select(
         where_expressions: Optional[List[BinaryExpression]] = None,
@@ -71,26 +163,34 @@ def patch_database_model(
             limit: The maximum number of objects to return.
 
         Returns:
-            List of DatabaseModels that match the parameters.
+            List of DatabaseModels that match the parameters. This is always a new
+            list, so changing it won't change the patched models, but the models in it
+            are the patched models themselves.
 
         """
         # This function currently does not support `order_by` parameter.
         if where_expressions is None:
-            return models
-
-        matched_models = [
-            model
-            for model in models
-            if all(
-                _evaluate_column_element(expr, model.to_dict())
-                for expr in where_expressions
+            return models[:limit]
+
+        # If the primary keys are all compared to values, only the model with those
+        # primary keys can match, so look it up rather than scanning every model.
+        primary_key_values, other_expressions = _split_primary_key_expressions(
+            where_expressions, primary_key_names
+        )
+        if primary_key_names and len(primary_key_values) == len(primary_key_names):
+            candidate_model = find_model(
+                tuple(primary_key_values[name] for name in primary_key_names)
             )
-        ]
+            candidate_models = [] if candidate_model is None else [candidate_model]
+            where_expressions = other_expressions
+        else:
+            candidate_models = models
 
-        if limit is None:
-            matched_models[:limit]
+        predicate = _compile_where_expressions(where_expressions)
+        matched_models = (model for model in candidate_models if predicate(model))
 
-        return matched_models
+        # Stop evaluating models once the limit is reached
+        return list(itertools.islice(matched_models, limit))
 
     async def create_list(models) -> List[DatabaseModel]:
         """Mock `create_list` function for DatabaseModel
@@ -102,9 +202,10 @@ def patch_database_model(
             The list of new DatabaseModels that have been saved.
 
         """
-        # Iterate through the list of orm objs and call save().
+        # Add the models directly rather than awaiting save() for each one, since
+        # create_list doesn't save nested models.
         for obj in models:
-            await obj.save()
+            upsert_model(obj)
 
         return models
 
@@ -120,43 +221,12 @@ def patch_database_model(
         # If include_nested_models is True, call save on all nested model attributes.
         # This requires that the nested models are also patched.
         if include_nested_models:
-            for attr_name in model._nested_model_attributes:
+            for attr_name in nested_model_attributes:
                 obj = getattr(model, attr_name)
                 if obj is not None:
                     await obj.save()
 
-        primary_keys = model_cls._primary_keys
-        # Put uuids into any primary key that isn't set yet.
-        for primary_key in primary_keys:
-            val = getattr(model, primary_key.name)
-            if val is None:
-                setattr(model, primary_key.name, str(uuid4()))
-
-        # Pull the primary keys out of the class and the values out of the provided
-        # database model. Then build a where_expression list to get the model matching those
-        # primary keys.
-        where_expressions = [
-            primary_key == getattr(model, primary_key.name)
-            for primary_key in primary_keys
-        ]
-        selected_models = [
-            model
-            for model in models
-            if all(
-                _evaluate_column_element(expr, model.to_dict())
-                for expr in where_expressions
-            )
-        ]
-
-        if len(selected_models) == 0:
-            # Add a new model to the models since this model didn't exist before.
-            models.append(model)
-        else:
-            # Update the matching model. Since these are primary keys there should only
-            # ever be one model matching the given where_expressions.
-            matched_model = selected_models[0]
-            for attr, val in model.dict().items():
-                setattr(matched_model, attr, val)
+        upsert_model(model)
 
     async def update_record(**kwargs: Any) -> DatabaseModel:
         """Mock `update_record` function for DatabaseModel
@@ -167,27 +237,16 @@ def patch_database_model(
         Returns:
             The updated DatabaseModel.
 
+        Raises:
+            DatabaseRecordNotFound: No model matches the given primary keys.
+
         """
-        primary_keys = model_cls._primary_keys
-
-        # Pull the primary keys out of the class and the values out of the provided
-        # kwargs. Then build a where_expression list to get the model matching those
-        # primary keys.
-        where_expressions = [
-            primary_key == kwargs[primary_key.name] for primary_key in primary_keys
-        ]
-        selected_models = [
-            model
-            for model in models
-            if all(
-                _evaluate_column_element(expr, model.to_dict())
-                for expr in where_expressions
-            )
-        ]
+        primary_key_values = {name: kwargs[name] for name in primary_key_names}
+        model = find_model(tuple(primary_key_values.values()))
+        if model is None:
+            raise DatabaseRecordNotFound(model_cls._table.name, **primary_key_values)
 
-        # Update the matching model. Since these are primary keys there should only
-        # ever be one model matching the given where_expressions.
-        model = selected_models[0]
+        # Update the matching model.
         for attr, val in kwargs.items():
             setattr(model, attr, val)
         return model
@@ -209,31 +268,24 @@ def patch_database_model(
         """
         models = await select(where_expressions)
         for model in models:
+            primary_key_values = get_primary_key_values(model)
             for attr, val in values.items():
                 setattr(model, attr, val)
+
+            # Re-index the model if the update changed its primary keys
+            new_primary_key_values = get_primary_key_values(model)
+            if new_primary_key_values != primary_key_values:
+                models_by_primary_key.pop(primary_key_values, None)
+                models_by_primary_key[new_primary_key_values] = model
         return models
 
     async def delete(model) -> None:
         """Mock `delete` function for DatabaseModel"""
-        primary_keys = model_cls._primary_keys
-
-        # Pull the primary keys out of the class and the values out of the provided
-        # database model. Then build a where_expression list to get the model matching those
-        # primary keys.
-        where_expressions = [
-            primary_key == getattr(model, primary_key.name)
-            for primary_key in primary_keys
-        ]
-
-        # Remove any models that match the given where_expression
-        models[:] = [
-            model
-            for model in models
-            if not all(
-                _evaluate_column_element(expr, model.to_dict())
-                for expr in where_expressions
-            )
-        ]
+        primary_key_values = get_primary_key_values(model)
+        remove_models(
+            lambda stored_model: get_primary_key_values(stored_model)
+            == primary_key_values
+        )
 
     async def delete_records(**kwargs: Any) -> None:
         """Mock `delete_records` function for DatabaseModel
@@ -241,23 +293,46 @@ def patch_database_model(
         Args:
             kwargs: The values used to find the records that should be deleted
 
+        Raises:
+            DatabaseModelMissingField: One of the fields provided does not exist on the
+                database table
+
         """
-        where_exp = []
-        for key, value in kwargs.items():
-            col = getattr(model_cls.columns, key)
+        # The kwargs are plain values, so compare them to the models directly rather
+        # than building and compiling SQLAlchemy expressions. List values match any of
+        # their items.
+        equal_values = []
+        in_values = []
+        for field_name, value in kwargs.items():
+            db_field_name = model_cls._nested_attr_table_field_map.get(
+                field_name, field_name
+            )
+            if db_field_name not in model_cls.columns:
+                raise DatabaseModelMissingField(model_cls.__name__, db_field_name)
+
             if isinstance(value, list):
-                where_exp.append(col.in_(value))
+                in_values.append((db_field_name, _InValues(value)))
             else:
-                where_exp.append(col == value)
-
-        # Remove any models that match the given where_expression
-        models[:] = [
-            model
-            for model in models
-            if not all(
-                _evaluate_column_element(expr, model.to_dict()) for expr in where_exp
+                equal_values.append((db_field_name, value))
+
+        def matches(model: DatabaseModel) -> bool:
+            """Check if a model matches all of the kwargs
+
+            Args:
+                model: The db model that represents a model in the "db".
+
+            Returns:
+                True if the model should be deleted.
+
+            """
+            return all(
+                _get_column_value(model, name) == value for name, value in equal_values
+            ) and all(
+                _get_column_value(model, name) in values for name, values in in_values
             )
-        ]
+
+        # Remove any models that match the given kwargs
+        remove_models(matches)
 
     # Add the patches. Note that create functionality is patched indirectly though
     # 'save' already, but add a spy on it anyway so we can test calls against it.
@@ -277,221 +352,451 @@ def patch_database_model(
         yield
 
 
-@functools.singledispatch
 def _evaluate_column_element(
-    column_element: ColumnElement, model: Dict[str, Any]
+    column_element: ColumnElement, model: DatabaseModel
 ) -> Any:
-    """Evaluate a ColumnElement on a dictionary representing a database model
-
-    This function can be overridden based on the type of ColumnElement to return
-    an element from the model, a static value, or the result of some operation (e.g.
-    addition).
+    """Evaluate a ColumnElement on a database model
 
     Args:
         column_element: The element to evaluate.
-        model: The model to evaluate the column element on. Represented as a dictionary
-            where the keys are column names.
+        model: The model to evaluate the column element on.
+
+    Returns:
+        An element from the model, a static value, or the result of some operation
+        (e.g. addition).
 
     """
-    raise Exception(f"Cannot evaluate a {column_element} object.")
+    return _compile_column_element(column_element)(model)
 
 
-@_evaluate_column_element.register(BooleanClauseList)
-def _evaluate_boolean_clause_list(
-    column_element: ClauseList, model: Dict[str, Any]
-) -> Any:
-    """Evaluates a boolean clause list and breaks it down into its sub column elements
+def _split_primary_key_expressions(
+    where_expressions: List[ColumnElement], primary_key_names: Sequence[str]
+) -> Tuple[Dict[str, Any], List[ColumnElement]]:
+    """Split out the where expressions that compare a primary key to a value
+
+    Only top level expressions, and the children of top level `and` clauses, are
+    considered since those must all be true for a model to match.
+
+    Args:
+        where_expressions: The expressions that will be `and`ed together.
+        primary_key_names: The names of the primary key columns.
+
+    Returns:
+        A tuple of the primary key values by column name, and the remaining
+        expressions that still need to be evaluated.
+
+    """
+    primary_key_values = {}
+    other_expressions = []
+    for expr in where_expressions:
+        if isinstance(expr, BooleanClauseList) and expr.operator is operators.and_:
+            sub_expressions = expr.get_children()
+        else:
+            sub_expressions = [expr]
+
+        for sub_expr in sub_expressions:
+            if (
+                isinstance(sub_expr, BinaryExpression)
+                and sub_expr.operator is operators.eq
+                and isinstance(sub_expr.left, Column)
+                and sub_expr.left.name in primary_key_names
+                and sub_expr.left.name not in primary_key_values
+                and isinstance(sub_expr.right, BindParameter)
+                and not sub_expr.right.expanding
+            ):
+                primary_key_values[sub_expr.left.name] = sub_expr.right.value
+            else:
+                other_expressions.append(sub_expr)
+
+    return primary_key_values, other_expressions
+
+
+# A compiled column element takes a database model and returns the evaluated value
+# for that model
+CompiledColumnElement = Callable[[DatabaseModel], Any]
+
+
+def _get_column_value(model: DatabaseModel, name: str) -> Any:
+    """Get the value of a table column from a database model
+
+    This matches the value `model.to_dict()` would have for the column, without
+    serializing the whole model.
+
+    Args:
+        model: The model to get the value from.
+        name: The name of the table column.
+
+    Returns:
+        The value of the column. For nested models this is the primary id of the
+        nested model.
+
+    """
+    attr_name = model._nested_table_field_attr_map.get(name, name)
+    value = model.__dict__.get(attr_name)
+    if value is not None and attr_name in model._nested_model_attributes:
+        return value.get_primary_id()
+    return value
+
+
+def _compile_where_expressions(
+    where_expressions: List[ColumnElement],
+) -> CompiledColumnElement:
+    """Compile a list of where expressions into a single predicate
+
+    The expressions are compiled once so scanning the models only has to call the
+    resulting closures rather than walking the SQLAlchemy expression trees per row.
+
+    Args:
+        where_expressions: The expressions that will be `and`ed together.
+
+    Returns:
+        A function that returns a truthy value if a model matches every expression.
+
+    """
+    predicates = [_compile_column_element(expr) for expr in where_expressions]
+
+    # Most selects filter on a single expression, so skip combining the results
+    if len(predicates) == 1:
+        return predicates[0]
+
+    # Pass generators rather than lists to `all` and `any` so they stop evaluating at
+    # the first result that settles them
+    return lambda model: all(predicate(model) for predicate in predicates)
+
+
+class _InValues:
+    """Values of an `in` comparison, checked against a set when they can be hashed"""
+
+    __slots__ = ("values", "value_set")
+
+    def __init__(self, values: Iterable[Any]) -> None:
+        """Initializer
+
+        Args:
+            values: The values to check membership against.
+
+        """
+        self.values = list(values)
+        try:
+            self.value_set = frozenset(self.values)
+        except TypeError:
+            # Not all values are hashable, so only the list can be used
+            self.value_set = None
+
+    def __contains__(self, value: Any) -> bool:
+        """Check if a value is one of the values
+
+        Args:
+            value: The value to look for. Unhashable values, like JSONB dicts, are
+                compared to each value in turn.
+
+        Returns:
+            True if the value equals one of the values.
+
+        """
+        if self.value_set is not None:
+            try:
+                return value in self.value_set
+            except TypeError:
+                pass
+        return value in self.values
+
+
+# The sqlalchemy `in`, `is` and `is_not` operators do not work on evaluated columns, so
+# they are replaced with the standard Python operators
+_OPERATOR_OVERRIDES = {
+    in_op: lambda x, y: x in y,
+    is_: python_operator.is_,
+    is_not: python_operator.ne,
+}
+
+# ColumnElements that evaluate to the same value for every model
+_CONSTANT_TYPES = (BindParameter, True_, False_, Null)
+
+# Functions that compile each type of ColumnElement, registered with
+# `_register_compiler`
+_COMPILERS: Dict[Type[ColumnElement], Callable[[Any], CompiledColumnElement]] = {}
+
+
+def _register_compiler(element_type: Type[ColumnElement]) -> Callable:
+    """Register the function that compiles a type of ColumnElement
+
+    Args:
+        element_type: The type of ColumnElement the function compiles.
+
+    Returns:
+        A decorator that registers the function.
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        """Add the function to the registered compilers
+
+        Args:
+            func: The function that compiles the ColumnElement type.
+
+        Returns:
+            The function.
+
+        """
+        _COMPILERS[element_type] = func
+        return func
+
+    return decorator
+
+
+def _compile_column_element(column_element: ColumnElement) -> CompiledColumnElement:
+    """Compile a ColumnElement into a function that evaluates it on a model
+
+    The structure of the expression is resolved up front and the returned closure can
+    be called for each model.
+
+    Args:
+        column_element: The element to compile.
+
+    Returns:
+        A function that evaluates the column element on a model.
+
+    Raises:
+        Exception: No compiler is registered for the type of the column element.
+
+    """
+    element_type = type(column_element)
+    compiler = _COMPILERS.get(element_type)
+    if compiler is None:
+        # Fall back to the compiler for the closest registered base class, and cache
+        # it so the MRO is only walked once per type
+        compiler = next(
+            (_COMPILERS[base] for base in element_type.__mro__ if base in _COMPILERS),
+            None,
+        )
+        if compiler is None:
+            raise Exception(f"Cannot evaluate a {column_element} object.")
+        _COMPILERS[element_type] = compiler
+
+    return compiler(column_element)
+
+
+def _get_constant_value(column_element: ColumnElement) -> Any:
+    """Get the value of a ColumnElement that is the same for every model
+
+    Args:
+        column_element: An element with one of the `_CONSTANT_TYPES`.
+
+    Returns:
+        The value of the element.
+
+    """
+    if isinstance(column_element, BindParameter):
+        return column_element.value
+    if isinstance(column_element, True_):
+        return True
+    if isinstance(column_element, False_):
+        return False
+    return None
+
+
+@_register_compiler(BooleanClauseList)
+def _compile_boolean_clause_list(
+    column_element: BooleanClauseList,
+) -> CompiledColumnElement:
+    """Compiles a boolean clause list from its sub column elements
 
     Args:
         column_element: The BooleanClauseList in question.
-        model: The model of data this clause should be evaluated for.
 
     Returns:
-        The result of the evaluation.
+        A function that evaluates the clause list on a model.
 
     """
     operator = column_element.operator
 
-    return functools.reduce(
-        operator,
-        [
-            _evaluate_column_element(sub_element, model)
-            for sub_element in column_element.get_children()
-        ],
+    if operator is operators.and_ or operator is operators.or_:
+        is_and = operator is operators.and_
+        # A constant child either settles the result (False for `and`, True for `or`)
+        # or can be dropped, so only compile the children that depend on the model
+        settling_type, ignored_type = (False_, True_) if is_and else (True_, False_)
+        sub_elements = []
+        for sub_element in column_element.get_children():
+            if isinstance(sub_element, settling_type):
+                return lambda model: not is_and
+            if not isinstance(sub_element, ignored_type):
+                sub_elements.append(_compile_column_element(sub_element))
+
+        # Short circuit on the first child that settles the result
+        if is_and:
+            return lambda model: all(sub_element(model) for sub_element in sub_elements)
+        return lambda model: any(sub_element(model) for sub_element in sub_elements)
+
+    sub_elements = [
+        _compile_column_element(sub_element)
+        for sub_element in column_element.get_children()
+    ]
+
+    return lambda model: functools.reduce(
+        operator, [sub_element(model) for sub_element in sub_elements]
     )
 
 
-@_evaluate_column_element.register(ClauseList)
-def _evaluate_clause_list(column_element: ClauseList, model: Dict[str, Any]) -> Any:
-    """Evaluates a clause list and breaks it down into its sub column elements
+@_register_compiler(ClauseList)
+def _compile_clause_list(column_element: ClauseList) -> CompiledColumnElement:
+    """Compiles a clause list from its sub column elements
 
     Args:
         column_element: The ClauseList in question.
-        model: The model of data this clause should be evaluated for.
 
     Returns:
-        The result of the evaluation.
+        A function that evaluates the clause list on a model.
 
     """
     operator = column_element.operator
+    sub_elements = [
+        _compile_column_element(sub_element)
+        for sub_element in column_element.get_children()
+    ]
 
-    return operator(
-        *[
-            _evaluate_column_element(sub_element, model)
-            for sub_element in column_element.get_children()
-        ]
-    )
+    return lambda model: operator(*[sub_element(model) for sub_element in sub_elements])
 
 
-@_evaluate_column_element.register(BinaryExpression)
-def _evaluate_binary_expression(
-    column_element: BinaryExpression, model: Dict[str, Any]
-) -> Any:
-    """Evaluates the binary expression
+@_register_compiler(BinaryExpression)
+def _compile_binary_expression(
+    column_element: BinaryExpression,
+) -> CompiledColumnElement:
+    """Compiles the binary expression
 
     Args:
-        column_element: The binary expression to evaluate.
-        model: The model to evaluate the expression on.
+        column_element: The binary expression to compile.
 
     Returns:
-        The evaluation response dictated by the operator of the expression.
+        A function that applies the operator of the expression to its evaluated left
+        and right sides.
 
     """
-    operator = column_element.operator
+    operator = _OPERATOR_OVERRIDES.get(column_element.operator, column_element.operator)
 
-    # The sqlalchemy `in` operator does not work on evaluated columns, so we replace
-    # it with the standard `in` operator.
-    if operator == in_op:
-        operator = lambda x, y: x in y
+    # Most expressions compare a column to a constant, so read those directly in the
+    # closure rather than calling a compiled function for each side
+    if isinstance(column_element.right, _CONSTANT_TYPES):
+        value = _get_constant_value(column_element.right)
+        if column_element.operator is in_op:
+            # `in` values are constant, so check membership against a set
+            value = _InValues(value)
 
-    # The sqlalchemy `is` operator does not work on evaluated columns, so we replace it
-    # with the standard `is` operator.
-    if operator == is_:
-        operator = lambda x, y: x is y
+        if isinstance(column_element.left, Column):
+            name = column_element.left.name
+            return lambda model: operator(_get_column_value(model, name), value)
 
-    # The sqlalchemy `is_not` operator does not work on evaluated columns, so we replace
-    # it with the standard `!=` operator.
-    if operator == is_not:
-        operator = lambda x, y: x != y
+        left = _compile_column_element(column_element.left)
+        return lambda model: operator(left(model), value)
 
-    return operator(
-        _evaluate_column_element(column_element.left, model),
-        _evaluate_column_element(column_element.right, model),
-    )
+    left = _compile_column_element(column_element.left)
+    right = _compile_column_element(column_element.right)
+
+    return lambda model: operator(left(model), right(model))
 
 
-@_evaluate_column_element.register(AsBoolean)
-def _evaluate_as_boolean(column_element: AsBoolean, model: Dict[str, Any]) -> Any:
-    """Evaluates a boolean
+@_register_compiler(AsBoolean)
+def _compile_as_boolean(column_element: AsBoolean) -> CompiledColumnElement:
+    """Compiles a boolean
 
     Args:
-        column_element: The boolean to evaluate.
-        model: The model to evaluate the expression on.
+        column_element: The boolean to compile.
 
     Returns:
-        The evaluation response dictated by the operator of the expression.
+        A function that evaluates the boolean on a model.
 
     """
-    result = bool(_evaluate_column_element(column_element.element, model))
+    element = _compile_column_element(column_element.element)
     if column_element.operator == is_false:
-        return not result
-    return result
+        return lambda model: not element(model)
+    return lambda model: bool(element(model))
 
 
-@_evaluate_column_element.register(Column)
-def _evaluate_column(column_element: Column, model: Dict[str, Any]) -> Any:
-    """Evaluate the column based on the column element name
+@_register_compiler(Column)
+def _compile_column(column_element: Column) -> CompiledColumnElement:
+    """Compiles a lookup of the column value on a model
 
     Args:
-        column_element: The column to evaluate.
-        model: The model dictionary.
+        column_element: The column to compile.
 
     Returns:
-        The value from the model of attribute referenced by column_element.
+        A function that returns the value of the column from the model.
 
     """
-    return model.get(column_element.name)
+    name = column_element.name
+    return lambda model: _get_column_value(model, name)
 
 
-@_evaluate_column_element.register(BindParameter)
-def _evaluate_bind_parameter(
-    column_element: BindParameter, model: Dict[str, Any]
-) -> Any:
-    """Evaluate the column_elements value
+@_register_compiler(BindParameter)
+def _compile_bind_parameter(column_element: BindParameter) -> CompiledColumnElement:
+    """Compiles the column_elements value
 
     Args:
         column_element: The column's bind parameter.
-        model: The model dictionary.
 
     Returns:
-        The value of the column_element
+        A function that returns the value of the column_element
 
     """
-    return column_element.value
+    value = column_element.value
+    return lambda model: value
 
 
-@_evaluate_column_element.register(True_)
-def _evaluate_true(column_element: True_, model: Dict[str, Any]) -> bool:
-    """Wrapper around evaluating True
+@_register_compiler(True_)
+def _compile_true(column_element: True_) -> CompiledColumnElement:
+    """Compiles True
 
     Args:
-        column_element: The column to evaluate. This is just True
-        model: The model dictionary.
+        column_element: The column to compile. This is just True
 
     Returns:
-        True
+        A function that returns True
 
     """
-    # The boolean value True is its own SQLAlchemy element
-    return True
+    return lambda model: True
 
 
-@_evaluate_column_element.register(False_)
-def _evaluate_false(column_element: False_, model: Dict[str, Any]) -> bool:
-    """Wrapper around evaluating False
+@_register_compiler(False_)
+def _compile_false(column_element: False_) -> CompiledColumnElement:
+    """Compiles False
 
     Args:
-        column_element: The column to evaluate. This just returns False
-        model: The model dictionary.
+        column_element: The column to compile. This is just False
 
     Returns:
-        False
+        A function that returns False
 
     """
-    # The boolean value False is its own SQLAlchemy element
-    return False
+    return lambda model: False
 
 
-@_evaluate_column_element.register(Grouping)
-def _evaluate_grouping(column_element: Grouping, model: Dict[str, Any]) -> List[Any]:
-    """Wrapper around evaluating a grouping
+@_register_compiler(Grouping)
+def _compile_grouping(column_element: Grouping) -> CompiledColumnElement:
+    """Compiles a grouping
 
     Args:
-        column_element: The grouping to evaluate.
-        model: The model dictionary.
+        column_element: The grouping to compile.
 
     Returns:
-        A list of of values that are the resulting of evaluating each element in the
-        group.
+        A function that returns a list of the values resulting from evaluating each
+        element in the group.
 
     """
-    return [
-        _evaluate_column_element(clause, model)
-        for clause in column_element.element.clauses
+    clauses = [
+        _compile_column_element(clause) for clause in column_element.element.clauses
     ]
+    return lambda model: [clause(model) for clause in clauses]
 
 
-@_evaluate_column_element.register(Null)
-def _evaluate_null(column_element: Null, model: Dict[str, Any]) -> Any:
-    """Wrapper around evaluating null
+@_register_compiler(Null)
+def _compile_null(column_element: Null) -> CompiledColumnElement:
+    """Compiles null
 
     Args:
-        column_element: The column element to evaluate. This is null
-        model: The model dictionary.
+        column_element: The column element to compile. This is null
 
     Returns:
-        None
+        A function that returns None
 
     """
-    # The Null value is its own SQLAlchemy element
-    return None
+    return lambda model: None
@@ -1,6 +1,6 @@
 """Tests for DatabaseModel abstract class"""
 import asyncio
-from asyncio import gather, sleep
+from asyncio import sleep
 from datetime import datetime
 import os
 from typing import Optional
@@ -14,8 +14,8 @@ from pynocular.database_model import database_model, UUID_STR
 from pynocular.db_util import (
     add_datetime_trigger,
     create_new_database,
-    create_table,
-    drop_table,
+    create_tables,
+    drop_tables,
 )
 from pynocular.engines import DBEngine, DBInfo
 from pynocular.exceptions import DatabaseModelMissingField, DatabaseRecordNotFound
@@ -52,6 +52,17 @@ class Org(BaseModel):
     updated_at: Optional[datetime] = Field(fetch_on_update=True)
 
 
+@database_model("projects", testdb)
+class Project(BaseModel):
+    """A test class with a field fetched on both create and update"""
+
+    id: UUID_STR = Field(primary_key=True)
+    name: str = Field(max_length=45)
+
+    created_at: Optional[datetime] = Field(fetch_on_create=True)
+    updated_at: Optional[datetime] = Field(fetch_on_create=True, fetch_on_update=True)
+
+
 @database_model("topics", testdb)
 class Topic(BaseModel):
     """A test class with a nullable JSONB field"""
@@ -75,11 +86,13 @@ class TestDatabaseModel:
             # If this fails, assume its already  created
             pass
 
-        await create_table(testdb, Org.get_table())
-        await create_table(testdb, Topic.get_table())
-        conn = await (await DBEngine.get_engine(testdb)).acquire()
-        await add_datetime_trigger(conn, "organizations")
-        await conn.close()
+        await create_tables(
+            testdb, Org.get_table(), Topic.get_table(), Project.get_table()
+        )
+        engine = await DBEngine.get_engine(testdb)
+        async with engine.acquire() as conn:
+            await add_datetime_trigger(conn, "organizations")
+            await add_datetime_trigger(conn, "projects")
 
     @classmethod
     def setup_class(cls):
@@ -89,9 +102,9 @@ class TestDatabaseModel:
 
     @classmethod
     async def _teardown_class(cls):
-        """Drop database tables"""
-        await drop_table(testdb, Org._table)
-        await drop_table(testdb, Topic._table)
+        """Drop database tables and close the engine"""
+        await drop_tables(testdb, Org._table, Topic._table, Project._table)
+        await DBEngine.close(testdb)
 
     @classmethod
     def teardown_class(cls):
@@ -118,25 +131,33 @@ class TestDatabaseModel:
     async def test_get_list(self) -> None:
         """Test that we can get_list and get a subset of DatabaseModels"""
         try:
-            org1 = await Org.create(
-                id=str(uuid4()), name="orgus borgus", slug="orgus_borgus", serial_id=1
-            )
-            org2 = await Org.create(
-                id=str(uuid4()), name="orgus borgus2", slug="orgus_borgus", serial_id=1
-            )
-            org3 = await Org.create(
-                id=str(uuid4()),
-                name="nonorgus borgus",
-                slug="orgus_borgus",
-                serial_id=2,
+            org1, org2, org3 = await Org.create_list(
+                [
+                    Org(
+                        id=str(uuid4()),
+                        name="orgus borgus",
+                        slug="orgus_borgus",
+                        serial_id=1,
+                    ),
+                    Org(
+                        id=str(uuid4()),
+                        name="orgus borgus2",
+                        slug="orgus_borgus",
+                        serial_id=1,
+                    ),
+                    Org(
+                        id=str(uuid4()),
+                        name="nonorgus borgus",
+                        slug="orgus_borgus",
+                        serial_id=2,
+                    ),
+                ]
             )
             all_orgs = await Org.select()
             subset_orgs = await Org.get_list(serial_id=org1.serial_id)
             assert len(subset_orgs) <= len(all_orgs)
         finally:
-            await org1.delete()
-            await org2.delete()
-            await org3.delete()
+            await Org.delete_records(id=[org1.id, org2.id, org3.id])
 
     @pytest.mark.asyncio
     async def test_get_list__none_filter_value(self) -> None:
@@ -197,7 +218,24 @@ class TestDatabaseModel:
             ]
             assert all(org.id is not None for org in created_orgs)
         finally:
-            await gather(*[org.delete() for org in created_orgs])
+            await Org.delete_records(id=[org.id for org in created_orgs])
+
+    @pytest.mark.asyncio
+    async def test_create_list__fetch_on_create_and_update(self) -> None:
+        """Test create_list with a field fetched on both create and update"""
+        try:
+            created_projects = await Project.create_list(
+                [
+                    Project(id=str(uuid4()), name="fake project 1"),
+                    Project(id=str(uuid4()), name="fake project 2"),
+                ]
+            )
+            assert all(project.created_at is not None for project in created_projects)
+            assert all(project.updated_at is not None for project in created_projects)
+        finally:
+            await Project.delete_records(
+                id=[project.id for project in created_projects]
+            )
 
     @pytest.mark.asyncio
     async def test_create_list__empty(self) -> None:
@@ -227,6 +265,27 @@ class TestDatabaseModel:
             # Make sure we delete org so we don't leak out of test
             await org.delete()
 
+    @pytest.mark.asyncio
+    async def test_update_new_record__save_fetch_on_create_and_update(self) -> None:
+        """Test save with a field fetched on both create and update"""
+        project = Project(id=str(uuid4()), name="fake project")
+
+        try:
+            await project.save()
+            assert project.created_at is not None
+            assert project.updated_at is not None
+
+            orig_updated = project.updated_at
+            await sleep(0.01)
+            project.name = "new project name"
+            await project.save()
+            assert project.updated_at != orig_updated
+
+            db_obj = await Project.get(project.id)
+            assert db_obj == project
+        finally:
+            await project.delete()
+
     @pytest.mark.asyncio
     async def test_update_new_record__update_record(self) -> None:
         """Test that we can update a database record using `update_record`"""
@@ -355,3 +414,22 @@ class TestDatabaseModel:
         finally:
             # Make sure we delete org so we don't leak out of test
             await org.delete()
+
+    @pytest.mark.asyncio
+    async def test_fetch__changed_record(self) -> None:
+        """Test that fetch picks up values changed in the database"""
+        org_id = str(uuid4())
+        try:
+            org = Org(id=org_id, name="fake org100", slug="fake slug100")
+            await org.save()
+            assert "serial_id" not in org.__fields_set__
+
+            # Change the value in the database without touching the local object
+            await Org.update_record(id=org_id, serial_id=300)
+            assert org.serial_id is None
+
+            await org.fetch()
+            assert org.serial_id == 300
+            assert "serial_id" in org.__fields_set__
+        finally:
+            await org.delete()
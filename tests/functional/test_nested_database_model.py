@@ -1,5 +1,6 @@
 """Tests for DatabaseModel abstract class"""
 import asyncio
+import copy
 from datetime import datetime
 import os
 from typing import Optional
@@ -12,8 +13,8 @@ from pynocular.database_model import database_model, nested_model, UUID_STR
 from pynocular.db_util import (
     add_datetime_trigger,
     create_new_database,
-    create_table,
-    drop_table,
+    create_tables,
+    drop_tables,
 )
 from pynocular.engines import DBEngine, DBInfo
 from pynocular.exceptions import NestedDatabaseModelNotResolved
@@ -94,13 +95,10 @@ class TestNestedDatabaseModel:
             # If this fails, assume its already  created
             pass
 
-        await create_table(testdb, User._table)
-        await create_table(testdb, Org._table)
-        await create_table(testdb, Topic._table)
-        await create_table(testdb, App._table)
-        conn = await (await DBEngine.get_engine(testdb)).acquire()
-        await add_datetime_trigger(conn, "organizations")
-        await conn.close()
+        await create_tables(testdb, User._table, Org._table, Topic._table, App._table)
+        engine = await DBEngine.get_engine(testdb)
+        async with engine.acquire() as conn:
+            await add_datetime_trigger(conn, "organizations")
 
     @classmethod
     def setup_class(cls):
@@ -111,10 +109,7 @@ class TestNestedDatabaseModel:
     @classmethod
     async def _teardown_class(cls):
         """Drop database tables"""
-        await drop_table(testdb, User._table)
-        await drop_table(testdb, Org._table)
-        await drop_table(testdb, Topic._table)
-        await drop_table(testdb, App._table)
+        await drop_tables(testdb, User._table, Org._table, Topic._table, App._table)
 
     @classmethod
     def teardown_class(cls):
@@ -127,8 +122,10 @@ class TestNestedDatabaseModel:
         """Test that we can resolve the reference for a foreign key"""
 
         try:
-            tech_owner = await User.create(id=str(uuid4()), username="owner1")
-            business_owner = await User.create(id=str(uuid4()), username="owner2")
+            tech_owner, business_owner = await asyncio.gather(
+                User.create(id=str(uuid4()), username="owner1"),
+                User.create(id=str(uuid4()), username="owner2"),
+            )
             org = await Org.create(
                 id=str(uuid4()),
                 name="fake org104",
@@ -151,8 +148,7 @@ class TestNestedDatabaseModel:
             assert org_get.business_owner == business_owner
         finally:
             await org.delete()
-            await tech_owner.delete()
-            await business_owner.delete()
+            await User.delete_records(id=[tech_owner.id, business_owner.id])
 
     @pytest.mark.asyncio
     async def test_swap_foreign_reference(self) -> None:
@@ -160,11 +156,9 @@ class TestNestedDatabaseModel:
         org_id = str(uuid4())
 
         try:
-            org1 = await Org.create(id=org_id, name="fake org104", slug="fake slug104")
-            org2 = await Org.create(
-                id=str(uuid4()),
-                name="fake org105",
-                slug="fake slug105",
+            org1, org2 = await asyncio.gather(
+                Org.create(id=org_id, name="fake org104", slug="fake slug104"),
+                Org.create(id=str(uuid4()), name="fake org105", slug="fake slug105"),
             )
 
             # Start with app pointing to the first org
@@ -187,8 +181,7 @@ class TestNestedDatabaseModel:
             await app_get.org.fetch()
             assert app_get.org == org2
         finally:
-            await org1.delete()
-            await org2.delete()
+            await Org.delete_records(id=[org1.id, org2.id])
             await app.delete()
 
     @pytest.mark.asyncio
@@ -253,8 +246,9 @@ class TestNestedDatabaseModel:
             await org.save(include_nested_models=True)
 
             # Get the org and user that should have persisted
-            org_get = await Org.get(org.id)
-            user_get = await User.get(business_owner.id)
+            org_get, user_get = await asyncio.gather(
+                Org.get(org.id), User.get(business_owner.id)
+            )
 
             assert org_get.business_owner.id == user_get.id
 
@@ -263,23 +257,25 @@ class TestNestedDatabaseModel:
             org_get.tech_owner = tech_owner
             await org_get.save(include_nested_models=True)
 
-            org_get = await Org.get(org_get.id)
-            user_get = await User.get(tech_owner.id)
+            org_get, user_get = await asyncio.gather(
+                Org.get(org_get.id), User.get(tech_owner.id)
+            )
 
             assert org_get.tech_owner.id == user_get.id
             assert org_get.business_owner.id == business_owner.id
         finally:
             await org.delete()
-            await tech_owner.delete()
-            await business_owner.delete()
+            await User.delete_records(id=[tech_owner.id, business_owner.id])
 
     @pytest.mark.asyncio
     async def test_serialization(self) -> None:
         """Test that we can handle nested models in serialization correctly"""
 
         try:
-            tech_owner = await User.create(id=str(uuid4()), username="owner1")
-            business_owner = await User.create(id=str(uuid4()), username="owner2")
+            tech_owner, business_owner = await asyncio.gather(
+                User.create(id=str(uuid4()), username="owner1"),
+                User.create(id=str(uuid4()), username="owner2"),
+            )
             org = await Org.create(
                 id=str(uuid4()),
                 name="fake org104",
@@ -306,7 +302,44 @@ class TestNestedDatabaseModel:
             org = await Org.get(org.id)
             org_dict = org.to_dict()
             assert org_dict == expected_org_dict
+        finally:
+            await org.delete()
+            await User.delete_records(id=[tech_owner.id, business_owner.id])
+
+    @pytest.mark.asyncio
+    async def test_unresolved_reference_attributes(self) -> None:
+        """Test attribute access on a nested model before it is resolved"""
+
+        try:
+            tech_owner = await User.create(id=str(uuid4()), username="owner1")
+            org = await Org.create(
+                id=str(uuid4()),
+                name="fake org104",
+                slug="fake slug104",
+                tech_owner=tech_owner,
+            )
+
+            org_get = await Org.get(org.id)
+            nested_owner = org_get.tech_owner
+
+            # The primary key is available without fetching the reference
+            assert nested_owner.id == tech_owner.id
+            assert nested_owner.get_primary_id() == tech_owner.id
+
+            # Dunder lookups shouldn't be proxied to the unresolved model
+            assert not hasattr(nested_owner, "__dict__")
+
+            nested_copy = copy.copy(nested_owner)
+            assert nested_copy.id == tech_owner.id
+            with pytest.raises(NestedDatabaseModelNotResolved):
+                nested_copy.username
+
+            with pytest.raises(AttributeError):
+                nested_owner.unknown_attribute = "value"
+
+            await nested_owner.fetch()
+            assert nested_owner.username == tech_owner.username
+            assert nested_owner.get_primary_id() == tech_owner.id
         finally:
             await org.delete()
             await tech_owner.delete()
-            await business_owner.delete()
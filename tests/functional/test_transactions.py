@@ -50,8 +50,6 @@ class TestDatabaseTransactions:
             pass
 
         await create_table(testdb, Org._table)
-        conn = await (await DBEngine.get_engine(testdb)).acquire()
-        await conn.close()
 
     @classmethod
     def setup_class(cls):
@@ -82,7 +80,7 @@ class TestDatabaseTransactions:
             all_orgs = await Org.select()
             assert len(all_orgs) == 2
         finally:
-            await asyncio.gather(*[org.delete() for org in all_orgs])
+            await Org.delete_records(id=[org.id for org in all_orgs])
 
     @pytest.mark.asyncio
     async def test_gathered_updates_raise_error(self) -> None:
@@ -101,7 +99,7 @@ class TestDatabaseTransactions:
             all_orgs = await Org.select()
             assert len(all_orgs) == 0
         finally:
-            await asyncio.gather(*[org.delete() for org in all_orgs])
+            await Org.delete_records(id=[org.id for org in all_orgs])
 
     @pytest.mark.asyncio
     async def test_serial_updates(self) -> None:
@@ -114,7 +112,7 @@ class TestDatabaseTransactions:
             all_orgs = await Org.select()
             assert len(all_orgs) == 2
         finally:
-            await asyncio.gather(*[org.delete() for org in all_orgs])
+            await Org.delete_records(id=[org.id for org in all_orgs])
 
     @pytest.mark.asyncio
     async def test_serial_updates_raise_error(self) -> None:
@@ -130,7 +128,7 @@ class TestDatabaseTransactions:
             all_orgs = await Org.select()
             assert len(all_orgs) == 0
         finally:
-            await asyncio.gather(*[org.delete() for org in all_orgs])
+            await Org.delete_records(id=[org.id for org in all_orgs])
 
     @pytest.mark.asyncio
     async def test_nested_updates(self) -> None:
@@ -145,7 +143,7 @@ class TestDatabaseTransactions:
             all_orgs = await Org.select()
             assert len(all_orgs) == 2
         finally:
-            await asyncio.gather(*[org.delete() for org in all_orgs])
+            await Org.delete_records(id=[org.id for org in all_orgs])
 
     @pytest.mark.asyncio
     async def test_nested_updates_raise_error(self) -> None:
@@ -164,7 +162,7 @@ class TestDatabaseTransactions:
             all_orgs = await Org.select()
             assert len(all_orgs) == 0
         finally:
-            await asyncio.gather(*[org.delete() for org in all_orgs])
+            await Org.delete_records(id=[org.id for org in all_orgs])
 
     @pytest.mark.asyncio
     async def test_nested_conditional_updates_raise_error(self) -> None:
@@ -183,7 +181,7 @@ class TestDatabaseTransactions:
             all_orgs = await Org.select()
             assert len(all_orgs) == 0
         finally:
-            await asyncio.gather(*[org.delete() for org in all_orgs])
+            await Org.delete_records(id=[org.id for org in all_orgs])
 
     @pytest.mark.asyncio
     async def test_open_transaction_decorator(self) -> None:
@@ -203,7 +201,7 @@ class TestDatabaseTransactions:
             all_orgs = await Org.select()
             assert len(all_orgs) == 2
         finally:
-            await asyncio.gather(*[org.delete() for org in all_orgs])
+            await Org.delete_records(id=[org.id for org in all_orgs])
 
     @pytest.mark.asyncio
     async def test_open_transaction_decorator_rolls_back(self) -> None:
@@ -224,4 +222,4 @@ class TestDatabaseTransactions:
             all_orgs = await Org.select()
             assert len(all_orgs) == 0
         finally:
-            await asyncio.gather(*[org.delete() for org in all_orgs])
+            await Org.delete_records(id=[org.id for org in all_orgs])
@@ -0,0 +1,46 @@
+"""Tests for cleaning database names"""
+import pytest
+
+from pynocular.db_util import get_cleaned_db_name
+from pynocular.exceptions import InvalidSqlIdentifierErr
+
+
+class TestGetCleanedDBName:
+    """Test cases for get_cleaned_db_name"""
+
+    def test_get_cleaned_db_name(self) -> None:
+        """Should clean a name to adhere to sql naming conventions"""
+        assert get_cleaned_db_name("12My-Table Name!") == "my_table_name"
+
+    def test_get_cleaned_db_name__already_clean(self) -> None:
+        """Should leave a clean name as it is"""
+        assert get_cleaned_db_name("organizations") == "organizations"
+        assert get_cleaned_db_name("_test_db_2") == "_test_db_2"
+
+    def test_get_cleaned_db_name__flags(self) -> None:
+        """Should only apply the requested cleaning"""
+        assert (
+            get_cleaned_db_name(
+                "My Table-Name",
+                lowercase=False,
+                replace_spaces_with_underscores=False,
+                remove_special_chars=False,
+            )
+            == "My Table_Name"
+        )
+        assert (
+            get_cleaned_db_name(
+                "my table-name",
+                replace_dashes_with_underscores=False,
+                remove_special_chars=False,
+            )
+            == "my_table-name"
+        )
+
+    def test_get_cleaned_db_name__invalid(self) -> None:
+        """Should raise if the cleaned name is empty or too long"""
+        with pytest.raises(InvalidSqlIdentifierErr):
+            get_cleaned_db_name("123")
+
+        with pytest.raises(InvalidSqlIdentifierErr):
+            get_cleaned_db_name("a" * 10, limit=5)
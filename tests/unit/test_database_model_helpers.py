@@ -0,0 +1,255 @@
+"""Tests for building DatabaseModel tables"""
+from enum import Enum
+from typing import Optional
+from uuid import uuid4
+
+from pydantic import BaseModel, constr, Field, validator
+from pydantic.types import UUID4
+import pytest
+
+from pynocular.database_model import (
+    database_model,
+    is_valid_uuid,
+    nested_model,
+    UUID_STR,
+)
+from pynocular.engines import DBInfo
+from pynocular.exceptions import DatabaseModelMisconfigured, DatabaseModelMissingField
+
+# Building the table doesn't need a database connection
+testdb = DBInfo("fake connection string")
+
+
+class Color(Enum):
+    """An enum used for a column type"""
+
+    red = "red"
+    blue = "blue"
+
+
+@database_model("widgets", testdb)
+class Widget(BaseModel):
+    """A test database model"""
+
+    id: UUID_STR = Field(primary_key=True)
+    name: str = Field(max_length=45)
+    description: str
+    color: Color
+
+
+@database_model("gadgets", testdb)
+class Gadget(BaseModel):
+    """Another test database model"""
+
+    id: UUID_STR = Field(primary_key=True)
+    name: str = Field(max_length=45)
+    description: str
+    color: Color
+
+
+class TestColumnTypes:
+    """Test class for the column types built for DatabaseModel tables"""
+
+    def test_constrained_str_types_are_shared(self) -> None:
+        """Fields with the same max length should share a VARCHAR type"""
+        assert Widget.columns.name.type is Gadget.columns.name.type
+        assert Widget.columns.name.type.length == 45
+
+    def test_types_are_shared(self) -> None:
+        """Fields with the same type should share the SQLAlchemy type"""
+        assert Widget.columns.id.type is Gadget.columns.id.type
+        assert Widget.columns.description.type is Gadget.columns.description.type
+
+    def test_enum_types_are_not_shared(self) -> None:
+        """Enum types are attached to a single table so shouldn't be shared"""
+        assert Widget.columns.color.type is not Gadget.columns.color.type
+
+    def test_nested_model_types_are_shared(self) -> None:
+        """Nested model types for the same reference should be built once"""
+        assert nested_model(Widget, reference_field="widget_id") is nested_model(
+            Widget, reference_field="widget_id"
+        )
+        assert nested_model(Widget) is not nested_model(Gadget)
+
+    def test_unsupported_type(self) -> None:
+        """Should raise if a field type has no column type"""
+        with pytest.raises(DatabaseModelMisconfigured):
+
+            @database_model("things", testdb)
+            class Thing(BaseModel):
+                """A model with an unsupported field type"""
+
+                id: UUID_STR = Field(primary_key=True)
+                data: bytes
+
+
+class TestFromDBRecord:
+    """Test class for building models from database records"""
+
+    def test_from_db_record(self) -> None:
+        """Should build models without validating when all fields are db native"""
+        assert Widget._construct_from_db_records
+        record = {
+            "id": str(uuid4()),
+            "name": "widget",
+            "description": "a widget",
+            "color": Color.red,
+        }
+        widget = Widget._from_db_record(record)
+        assert widget == Widget(**record)
+        assert widget.__fields_set__ == set(record)
+
+    def test_from_db_record__uuid4_field(self) -> None:
+        """Should validate records for fields that need converting"""
+
+        @database_model("sprockets", testdb)
+        class Sprocket(BaseModel):
+            """A model with a UUID4 primary key"""
+
+            id: UUID4 = Field(primary_key=True)
+
+        assert not Sprocket._construct_from_db_records
+        sprocket_id = uuid4()
+        assert Sprocket._from_db_record({"id": str(sprocket_id)}).id == sprocket_id
+
+    def test_from_db_record__validator(self) -> None:
+        """Should validate records for models with custom validators"""
+
+        @database_model("cogs", testdb)
+        class Cog(BaseModel):
+            """A model with a custom validator"""
+
+            id: UUID_STR = Field(primary_key=True)
+            name: str
+
+            @validator("name")
+            def upper_name(cls, name: str) -> str:
+                """Upper case the name"""
+                return name.upper()
+
+        assert not Cog._construct_from_db_records
+        assert Cog._from_db_record({"id": str(uuid4()), "name": "cog"}).name == "COG"
+
+    def test_from_db_record__use_enum_values(self) -> None:
+        """Should validate records for models whose config changes values"""
+
+        @database_model("gears", testdb)
+        class Gear(BaseModel):
+            """A model that stores enum values"""
+
+            id: UUID_STR = Field(primary_key=True)
+            color: Color
+
+            class Config:
+                use_enum_values = True
+
+        assert not Gear._construct_from_db_records
+        gear = Gear._from_db_record({"id": str(uuid4()), "color": Color.red})
+        assert gear.color == "red"
+        assert not isinstance(gear.color, Color)
+
+    def test_from_db_record__lower_case_string(self) -> None:
+        """Should validate records for constrained types that change values"""
+
+        @database_model("levers", testdb)
+        class Lever(BaseModel):
+            """A model with a lower cased name"""
+
+            id: UUID_STR = Field(primary_key=True)
+            name: constr(to_lower=True)
+
+        assert not Lever._construct_from_db_records
+        assert Lever._from_db_record({"id": str(uuid4()), "name": "LEVER"}).name == (
+            "lever"
+        )
+
+    def test_from_db_record__custom_init(self) -> None:
+        """Should build records through the initializer when it is overridden"""
+
+        @database_model("pulleys", testdb)
+        class Pulley(BaseModel):
+            """A model with a custom initializer"""
+
+            id: UUID_STR = Field(primary_key=True)
+            name: str
+
+            def __init__(self, **data) -> None:
+                """Strip the name before validating"""
+                data["name"] = data["name"].strip()
+                super().__init__(**data)
+
+        assert not Pulley._construct_from_db_records
+        assert Pulley._from_db_record({"id": str(uuid4()), "name": " p "}).name == "p"
+
+
+class TestToDict:
+    """Test class for DatabaseModel.to_dict"""
+
+    def test_to_dict(self) -> None:
+        """Should return the same values as the Pydantic dict"""
+        widget = Widget(
+            id=str(uuid4()), name="widget", description="a widget", color=Color.red
+        )
+        assert widget.to_dict() == widget.dict()
+        assert widget.to_dict(serialize=True)["color"] == "red"
+
+    def test_to_dict__container_field(self) -> None:
+        """Should copy container values so the model can't be changed through them"""
+
+        @database_model("doohickeys", testdb)
+        class Doohickey(BaseModel):
+            """A model with a JSON field"""
+
+            id: UUID_STR = Field(primary_key=True)
+            settings: Optional[dict]
+
+        doohickey = Doohickey(id=str(uuid4()), settings={"size": {"width": 1}})
+        doohickey_dict = doohickey.to_dict()
+        doohickey_dict["settings"]["size"]["width"] = 2
+        assert doohickey.settings == {"size": {"width": 1}}
+        assert Doohickey(id=str(uuid4()), settings=None).to_dict()["settings"] is None
+
+
+class TestIsValidUUID:
+    """Test class for is_valid_uuid"""
+
+    def test_is_valid_uuid(self) -> None:
+        """Should accept canonical UUID strings"""
+        assert is_valid_uuid(str(uuid4()))
+        assert is_valid_uuid(str(uuid4()).upper())
+
+    def test_is_valid_uuid__other_forms(self) -> None:
+        """Should accept the other forms the UUID constructor accepts"""
+        uuid = uuid4()
+        assert is_valid_uuid(uuid.hex)
+        assert is_valid_uuid(f"{{{uuid}}}")
+        assert is_valid_uuid(f"urn:uuid:{uuid}")
+
+    def test_is_valid_uuid__invalid(self) -> None:
+        """Should reject values that aren't UUID strings"""
+        assert not is_valid_uuid("Table1")
+        assert not is_valid_uuid("")
+        assert not is_valid_uuid(None)
+        assert not is_valid_uuid(uuid4())
+        assert not is_valid_uuid("g" + str(uuid4())[1:])
+        assert not is_valid_uuid(str(uuid4())[:-1] + "-")
+
+
+class TestUUIDStr:
+    """Test class for UUID_STR validation"""
+
+    def test_validate(self) -> None:
+        """Should return valid UUID strings as they are"""
+        uuid = str(uuid4())
+        assert UUID_STR.validate(uuid) is uuid
+
+    def test_validate__uuid(self) -> None:
+        """Should convert UUIDs to strings"""
+        uuid = uuid4()
+        assert UUID_STR.validate(uuid) == str(uuid)
+
+    def test_validate__invalid(self) -> None:
+        """Should raise for values that aren't UUIDs"""
+        for value in ("Table1", None, 1):
+            with pytest.raises(ValueError):
+                UUID_STR.validate(value)
@@ -4,11 +4,17 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 import pytest
-from sqlalchemy import or_
+from sqlalchemy import and_, false, or_
 
 from pynocular.database_model import database_model, nested_model, UUID_STR
 from pynocular.engines import DBInfo
-from pynocular.patch_models import _evaluate_column_element, patch_database_model
+from pynocular.exceptions import DatabaseModelMissingField, DatabaseRecordNotFound
+from pynocular.patch_models import (
+    _compile_where_expressions,
+    _evaluate_column_element,
+    _split_primary_key_expressions,
+    patch_database_model,
+)
 
 # With the `patch_database_model` we don't need a database connection
 test_connection_string = "fake connection string"
@@ -42,6 +48,13 @@ class Org(BaseModel):
     flag3: bool = Field(default=True)
 
 
+@database_model("events", testdb)
+class Event(BaseModel):
+    """Model for a table without a primary key"""
+
+    name: str
+
+
 class TestPatchDatabaseModel:
     """Test class for patch_database_model"""
 
@@ -127,9 +140,7 @@ class TestPatchDatabaseModel:
             assert len(db_orgs) == 2
 
             # Confirm the correct orgs are left
-            sorted_orgs = sorted(orgs[1:3], key=lambda x: x.id)
-            sorted_db_orgs = sorted(db_orgs, key=lambda x: x.id)
-            assert sorted_orgs == sorted_db_orgs
+            assert {o.id: o for o in orgs[1:3]} == {o.id: o for o in db_orgs}
 
     @pytest.mark.asyncio
     async def test_patch_database_model_with_delete_records(self) -> None:
@@ -150,6 +161,27 @@ class TestPatchDatabaseModel:
             # Confirm the correct org is left
             assert orgs[0] == db_orgs[0]
 
+    @pytest.mark.asyncio
+    async def test_patch_database_model_with_delete_records__nested(self) -> None:
+        """Test that `delete_records` can filter on nested model attributes"""
+        user = User(id=str(uuid4()), username="Bob")
+        orgs = [
+            Org(
+                id=str(uuid4()),
+                name="orgus borgus",
+                slug="orgus_borgus",
+                tech_owner=user,
+            ),
+            Org(id=str(uuid4()), name="orgus borgus2", slug="orgus_borgus2"),
+        ]
+
+        with patch_database_model(Org, models=orgs):
+            with pytest.raises(DatabaseModelMissingField):
+                await Org.delete_records(owner=user.id)
+
+            await Org.delete_records(tech_owner=user.id, name="orgus borgus")
+            assert await Org.get_list() == orgs[1:]
+
     @pytest.mark.asyncio
     async def test_patch_database_model_with_update(self) -> None:
         """Test that we can use `update` to update multiple models"""
@@ -169,21 +201,254 @@ class TestPatchDatabaseModel:
             assert {org.id for org in updated} == {org.id for org in orgs[:2]}
             assert all(org.name == "foo" and org.slug == "bar" for org in updated)
 
+    @pytest.mark.asyncio
+    async def test_patch_database_model_with_update_record__not_found(self) -> None:
+        """Test that `update_record` raises if no model has the primary key"""
+        orgs = [Org(id=str(uuid4()), name="orgus borgus", slug="orgus_borgus")]
+
+        with patch_database_model(Org, models=orgs):
+            with pytest.raises(DatabaseRecordNotFound):
+                await Org.update_record(id=str(uuid4()), name="foo")
+
+            org = await Org.update_record(id=orgs[0].id, name="foo")
+            assert org is orgs[0]
+            assert org.name == "foo"
+
+    @pytest.mark.asyncio
+    async def test_patch_database_model_primary_key_lookups(self) -> None:
+        """Test that lookups by primary key follow saves, updates and deletes"""
+        orgs = [
+            Org(id=str(uuid4()), name="orgus borgus", slug="orgus_borgus"),
+            Org(id=str(uuid4()), name="orgus borgus2", slug="orgus_borgus2"),
+        ]
+
+        with patch_database_model(Org, models=orgs):
+            # Saving a copy should update the existing model rather than add one
+            org_copy = orgs[0].copy()
+            org_copy.name = "new name"
+            await org_copy.save()
+            assert len(await Org.get_list()) == 2
+            assert orgs[0].name == "new name"
+
+            # Changing the primary key through `update` should move the model
+            new_id = str(uuid4())
+            await Org.update([Org.columns.id == orgs[1].id], values={"id": new_id})
+            updated_org = await Org.update_record(id=new_id, name="moved")
+            assert updated_org is orgs[1]
+
+            await orgs[0].delete()
+            assert await Org.get_list() == [orgs[1]]
+            with pytest.raises(DatabaseRecordNotFound):
+                await Org.update_record(id=orgs[0].id, name="foo")
+
+            # Saving the deleted model should add it back
+            await orgs[0].save()
+            assert len(await Org.get_list()) == 2
+
+    @pytest.mark.asyncio
+    async def test_patch_database_model_primary_key_changed_in_place(self) -> None:
+        """Test that lookups by primary key find models whose keys were set directly"""
+        orgs = [
+            Org(id=str(uuid4()), name="orgus borgus", slug="orgus_borgus"),
+            Org(id=str(uuid4()), name="orgus borgus2", slug="orgus_borgus2"),
+        ]
+
+        with patch_database_model(Org, models=orgs):
+            old_id = orgs[0].id
+            orgs[0].id = str(uuid4())
+            assert await Org.get(orgs[0].id) is orgs[0]
+            assert await Org.select([Org.columns.id == old_id]) == []
+
+            updated_org = await Org.update_record(id=orgs[0].id, name="moved")
+            assert updated_org is orgs[0]
+
+            await orgs[0].delete()
+            assert await Org.get_list() == [orgs[1]]
+
+    @pytest.mark.asyncio
+    async def test_patch_database_model_without_primary_key(self) -> None:
+        """Test that models without a primary key can be patched"""
+        events = [Event(name="started"), Event(name="stopped")]
+
+        with patch_database_model(Event, models=events):
+            assert await Event.get_list(name="stopped") == [events[1]]
+            await Event.delete_records(name="started")
+            assert await Event.get_list() == [events[1]]
+
+    @pytest.mark.asyncio
+    async def test_patch_database_model_delete_records__unhashable(self) -> None:
+        """Test that `delete_records` can match list values against any column value"""
+        events = [Event(name="started"), Event.construct(name={"state": "stopped"})]
+
+        with patch_database_model(Event, models=events):
+            await Event.delete_records(name=["started", {"state": "paused"}])
+            assert await Event.get_list() == [events[1]]
+            await Event.delete_records(name=["started"])
+            assert await Event.get_list() == [events[1]]
+
+    @pytest.mark.asyncio
+    async def test_patch_database_model_select_with_limit(self) -> None:
+        """Test that `select` returns at most `limit` models"""
+        orgs = [
+            Org(id=str(uuid4()), name="orgus borgus", slug="orgus_borgus"),
+            Org(id=str(uuid4()), name="orgus borgus", slug="orgus_borgus"),
+            Org(id=str(uuid4()), name="nonorgus borgus", slug="nonorgus_borgus"),
+        ]
+
+        with patch_database_model(Org, models=orgs):
+            assert await Org.select(limit=2) == orgs[:2]
+
+            # Changing the returned list shouldn't change the patched models
+            all_orgs = await Org.select()
+            all_orgs.clear()
+            assert await Org.select() == orgs
+            matched_orgs = await Org.select([Org.columns.slug == "orgus_borgus"])
+            assert matched_orgs == orgs[:2]
+            limited_orgs = await Org.select(
+                [Org.columns.slug == "orgus_borgus"], limit=1
+            )
+            assert limited_orgs == orgs[:1]
+
+    @pytest.mark.asyncio
+    async def test_patch_database_model_select_by_primary_key(self) -> None:
+        """Test that `select` handles where expressions on the primary key"""
+        orgs = [
+            Org(id=str(uuid4()), name="orgus borgus", slug="orgus_borgus"),
+            Org(id=str(uuid4()), name="orgus borgus2", slug="orgus_borgus2"),
+        ]
+
+        with patch_database_model(Org, models=orgs):
+            assert await Org.select([Org.columns.id == orgs[1].id]) == [orgs[1]]
+            assert await Org.select(
+                [and_(Org.columns.id == orgs[0].id, Org.columns.name == "orgus borgus")]
+            ) == [orgs[0]]
+            assert (
+                await Org.select(
+                    [Org.columns.id == orgs[0].id, Org.columns.name == "other"]
+                )
+                == []
+            )
+            assert await Org.select([Org.columns.id == str(uuid4())]) == []
+
+
+class TestSplitPrimaryKeyExpressions:
+    """Test class for the _split_primary_key_expressions function"""
+
+    def test_split_primary_key_expressions(self) -> None:
+        """Should split out equality comparisons of primary keys to values"""
+        name_expr = Org.columns.name == "foo"
+        slug_expr = Org.columns.slug.in_(["foo"])
+        primary_key_values, other_expressions = _split_primary_key_expressions(
+            [and_(Org.columns.id == "1", name_expr), slug_expr], ["id"]
+        )
+        assert primary_key_values == {"id": "1"}
+        assert other_expressions == [name_expr, slug_expr]
+
+    def test_split_primary_key_expressions__or(self) -> None:
+        """Should not split out primary keys compared within an `or`"""
+        expr = or_(Org.columns.id == "1", Org.columns.id == "2")
+        primary_key_values, other_expressions = _split_primary_key_expressions(
+            [expr], ["id"]
+        )
+        assert primary_key_values == {}
+        assert other_expressions == [expr]
+
 
 class TestEvaluateColumnElement:
     """Test class for the _evaluate_column_element function"""
 
     def test_evaluate_column_element__neq(self) -> None:
         """Should handle the is_not operator"""
-        assert not _evaluate_column_element(Org.columns.name != "foo", {"name": "foo"})
+        assert not _evaluate_column_element(
+            Org.columns.name != "foo", Org.construct(name="foo")
+        )
 
     def test_evaluate_column_element__n_ary_or(self) -> None:
         """Should handle an OR with multiple arguments"""
         assert _evaluate_column_element(
             or_(Org.columns.flag1, Org.columns.flag2, Org.columns.flag3),
-            {"flag1": False, "flag2": False, "flag3": True},
+            Org.construct(flag1=False, flag2=False, flag3=True),
         )
 
     def test_evaluate_column_element__not(self) -> None:
         """Should handle a NOT operator"""
-        assert not _evaluate_column_element(~Org.columns.flag1, {"flag1": True})
+        assert not _evaluate_column_element(
+            ~Org.columns.flag1, Org.construct(flag1=True)
+        )
+
+
+class TestCompileWhereExpressions:
+    """Test class for the _compile_where_expressions function"""
+
+    def test_compile_where_expressions(self) -> None:
+        """Should match only models that satisfy every expression"""
+        predicate = _compile_where_expressions(
+            [Org.columns.name == "foo", Org.columns.slug.in_(["bar", "baz"])]
+        )
+        assert predicate(Org.construct(name="foo", slug="baz"))
+        assert not predicate(Org.construct(name="foo", slug="qux"))
+        assert not predicate(Org.construct(name="qux", slug="bar"))
+
+    def test_compile_where_expressions__empty(self) -> None:
+        """Should match every model when there are no expressions"""
+        assert _compile_where_expressions([])(Org.construct(name="foo"))
+
+    def test_compile_where_expressions__is_null(self) -> None:
+        """Should handle the is_ and is_not operators"""
+        assert _compile_where_expressions([Org.columns.slug.is_(None)])(
+            Org.construct(slug=None)
+        )
+        assert not _compile_where_expressions([Org.columns.slug.isnot(None)])(
+            Org.construct(slug=None)
+        )
+
+    def test_compile_where_expressions__columns(self) -> None:
+        """Should handle comparing two columns"""
+        predicate = _compile_where_expressions([Org.columns.name == Org.columns.slug])
+        assert predicate(Org.construct(name="foo", slug="foo"))
+        assert not predicate(Org.construct(name="foo", slug="bar"))
+
+    def test_compile_where_expressions__and_or(self) -> None:
+        """Should handle `and` and `or` clauses, including constant children"""
+        predicate = _compile_where_expressions(
+            [
+                or_(
+                    and_(Org.columns.flag1, Org.columns.flag2),
+                    and_(Org.columns.flag3, false()),
+                    or_(false(), Org.columns.name == "foo"),
+                )
+            ]
+        )
+        assert predicate(Org.construct(flag1=True, flag2=True, flag3=False))
+        assert predicate(Org.construct(flag1=True, flag2=False, name="foo"))
+        assert not predicate(Org.construct(flag1=True, flag2=False, flag3=True))
+
+    def test_compile_where_expressions__in(self) -> None:
+        """Should handle `in` with hashable and unhashable values"""
+        predicate = _compile_where_expressions([Org.columns.name.in_(["foo", "bar"])])
+        assert predicate(Org.construct(name="bar"))
+        assert not predicate(Org.construct(name="baz"))
+
+        predicate = _compile_where_expressions(
+            [Org.columns.name.in_([{"foo": 1}, {"bar": 2}])]
+        )
+        assert predicate(Org.construct(name={"bar": 2}))
+        assert not predicate(Org.construct(name={"baz": 3}))
+
+        # Unhashable column values can't be found in a set of hashable values
+        predicate = _compile_where_expressions([Org.columns.name.in_(["foo", "bar"])])
+        assert not predicate(Org.construct(name={"foo": 1}))
+
+    def test_compile_where_expressions__not(self) -> None:
+        """Should handle a NOT operator"""
+        predicate = _compile_where_expressions([~Org.columns.flag1])
+        assert predicate(Org.construct(flag1=False))
+        assert not predicate(Org.construct(flag1=True))
+
+    def test_compile_where_expressions__nested_model(self) -> None:
+        """Should compare nested model columns to the nested model primary id"""
+        user = User(id=str(uuid4()), username="Bob")
+        predicate = _compile_where_expressions([Org.columns.tech_owner_id == user.id])
+        assert predicate(Org.construct(tech_owner=user))
+        assert not predicate(Org.construct(tech_owner=None))
+        assert not predicate(Org.construct(business_owner=user))
@@ -47,3 +47,24 @@ async def test_task_context_connection_shared(locked_connection) -> None:
     assert test_conn is None
     test_conn2 = context_conn2.get()
     assert test_conn2 is None
+
+
+@pytest.mark.asyncio()
+async def test_task_context_connection_separate_keys(locked_connection) -> None:
+    """Test that clearing one key leaves connections for other keys alone"""
+
+    context_conn = TaskContextConnection("key1")
+    context_conn.set(locked_connection)
+
+    other_connection = LockedConnection(Mock())
+    context_conn2 = TaskContextConnection("key2")
+    context_conn2.set(other_connection)
+    assert context_conn.get() == locked_connection
+    assert context_conn2.get() == other_connection
+
+    context_conn2.clear()
+    assert context_conn.get() == locked_connection
+    assert context_conn2.get() is None
+
+    context_conn.clear()
+    assert context_conn.get() is None